@@ -878,6 +878,57 @@ class ZowietekClient:
             requires_auth=True,
         )
 
+    async def async_replace_decoding_url(
+        self,
+        index: int,
+        name: str,
+        url: str,
+        streamtype: int = 1,
+        *,
+        active: bool = False,
+    ) -> None:
+        """Point an existing playback source at a new URL and start it.
+
+        The device only picks up a new URL on an off-to-on transition, so an
+        active source is switched off first. The update and enable are then
+        sent as a single modify with switch=1, mirroring how new sources are
+        added. If the device rejects the combined request, the URL is updated
+        with switch=0 and the source enabled separately.
+
+        Args:
+            index: Index of the source to replace.
+            name: Display name for the source.
+            url: New stream URL.
+            streamtype: Stream type. Defaults to 1.
+            active: Whether the source is currently enabled.
+
+        Raises:
+            ZowietekAuthError: If authentication fails.
+            ZowietekApiError: If any of the operations fail.
+        """
+        if active:
+            await self.async_disable_streamplay_source(index)
+        try:
+            await self.async_modify_decoding_url(
+                index=index,
+                name=name,
+                url=url,
+                streamtype=streamtype,
+                switch=True,
+            )
+        except ZowietekApiError as err:
+            if err.status_code != STATUS_INVALID_PARAMS:
+                raise
+            _LOGGER.debug("Combined modify and enable rejected, retrying in two steps")
+            await self.async_modify_decoding_url(
+                index=index,
+                name=name,
+                url=url,
+                streamtype=streamtype,
+                switch=False,
+            )
+            await self.async_select_streamplay_source(index)
+
     async def async_delete_decoding_url(self, index: int) -> None:
         """Delete a playback source.
 
@@ -940,6 +991,24 @@ class ZowietekClient:
             requires_auth=True,
         )
 
+    async def async_reload_streamplay_source(self, index: int) -> None:
+        """Force a streamplay source to reload by switching it off and on.
+
+        The device has no dedicated reload operation and only picks up a new
+        stream when the source transitions from off to on, so the two switch
+        requests are issued back-to-back over the client's keep-alive session.
+        They must stay sequential: the enable must not race the disable.
+
+        Args:
+            index: Index of the source to reload.
+
+        Raises:
+            ZowietekAuthError: If authentication fails.
+            ZowietekApiError: If the operation fails.
+        """
+        await self.async_disable_streamplay_source(index)
+        await self.async_select_streamplay_source(index)
+
     async def async_stop_streamplay(self) -> None:
         """Stop current streamplay/decoder playback.
 
@@ -13,6 +13,7 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.const import EntityCategory
 
 from . import ZowietekConfigEntry
+from .const import ON_VALUES
 from .coordinator import ZowietekCoordinator
 from .entity import ZowietekEntity
 
@@ -161,11 +162,8 @@ class ZowietekBinarySensor(ZowietekEntity, BinarySensorEntity):
         if signal is None:
             signal = video_data.get("input_hdmi_signal")
 
-        if signal is None:
-            return False
-
         # Handle both int and string values
-        return str(signal) == "1"
+        return signal in ON_VALUES
 
     def _is_ndi_enabled(self) -> bool:
         """Check if NDI streaming is enabled.
@@ -179,16 +177,13 @@ class ZowietekBinarySensor(ZowietekEntity, BinarySensorEntity):
         # Coordinator stores NDI switch under 'ndi_switch' key
         ndi_switch = stream_data.get("ndi_switch")
 
-        if ndi_switch is None:
-            return False
-
         # Handle both int and string values
-        return str(ndi_switch) == "1"
+        return ndi_switch in ON_VALUES
 
     def _is_stream_protocol_enabled(self, protocol: str) -> bool:
         """Check if a specific streaming protocol is enabled.
 
-        Checks the publish list for entries matching the protocol type.
+        Looks up the publish entry the coordinator indexed for the protocol.
         The API uses 'switch' field for enabled state and 'type' for protocol.
 
         Args:
@@ -197,24 +192,13 @@ class ZowietekBinarySensor(ZowietekEntity, BinarySensorEntity):
         Returns:
             True if the specified protocol is enabled.
         """
-        stream_data = self.coordinator.data.stream
-        publish_list = stream_data.get("publish")
-
-        if not isinstance(publish_list, list):
+        entry = self.coordinator.data.publish_by_type.get(protocol)
+        if entry is None:
             return False
 
-        for entry in publish_list:
-            if not isinstance(entry, dict):
-                continue
-            if entry.get("type") == protocol:
-                # API uses 'switch' field for enabled state
-                switch = entry.get("switch")
-                if switch is None:
-                    return False
-                # Handle both int and string values
-                return str(switch) == "1"
-
-        return False
+        # API uses 'switch' field for enabled state
+        # Handle both int and string values
+        return entry.get("switch") in ON_VALUES
 
 
 async def async_setup_entry(
@@ -21,6 +21,13 @@ DEFAULT_SCAN_INTERVAL = 30  # seconds
 MIN_SCAN_INTERVAL = 10
 MAX_SCAN_INTERVAL = 300
 
+# Delay before reconciling optimistic state with the device
+OPTIMISTIC_RECONCILE_DELAY = 2  # seconds
+
+# Raw switch/signal flag values meaning "on". Depending on firmware the
+# device reports these as ints or digit strings.
+ON_VALUES = frozenset({1, "1"})
+
 # go2rtc configuration
 CONF_USE_GO2RTC = "use_go2rtc"
 DEFAULT_USE_GO2RTC = True
@@ -32,6 +39,8 @@ GO2RTC_DOMAIN = "go2rtc"
 GO2RTC_DEFAULT_API_URL = "http://127.0.0.1:11984"
 GO2RTC_DEFAULT_RTSP_PORT = 18554  # HA-managed go2rtc uses non-standard port
 GO2RTC_EXTERNAL_RTSP_PORT = 8554  # Standard go2rtc RTSP port for external servers
+GO2RTC_API_TIMEOUT = 10  # seconds
+GO2RTC_API_MAX_CONNECTIONS = 4  # Persistent connections to the go2rtc API
 
 # go2rtc stream management
 GO2RTC_STREAM_PREFIX = "zowietek_"
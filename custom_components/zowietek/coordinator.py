@@ -9,9 +9,11 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_DEVICE_ID, CONF_HOST, CONF_PASSWORD, CONF_TYPE, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import ZowietekClient
@@ -21,6 +23,8 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_USE_GO2RTC,
     DOMAIN,
+    ON_VALUES,
+    OPTIMISTIC_RECONCILE_DELAY,
 )
 from .device_trigger import EVENT_TYPE
 from .exceptions import (
@@ -73,10 +77,14 @@ class ZowietekCoordinator(DataUpdateCoordinator[ZowietekData]):
             update_interval=timedelta(seconds=scan_interval),
         )
         self.config_entry = entry
+        # Reuse Home Assistant's pooled session so back-to-back commands ride
+        # kept-alive connections; credentials travel in the request body, so
+        # no per-device cookie state is shared.
         self.client = ZowietekClient(
             host=entry.data[CONF_HOST],
             username=entry.data[CONF_USERNAME],
             password=entry.data[CONF_PASSWORD],
+            session=async_get_clientsession(hass),
         )
         self._consecutive_failures: int = 0
         # Track previous state for device trigger events
@@ -85,6 +93,14 @@ class ZowietekCoordinator(DataUpdateCoordinator[ZowietekData]):
         # go2rtc integration (initialized by async_setup_entry)
         self.go2rtc_helper: Go2rtcHelper | None = None
         self.go2rtc_enabled: bool = entry.options.get(CONF_USE_GO2RTC, DEFAULT_USE_GO2RTC)
+        # Delayed refresh that reconciles optimistic entity updates
+        self._reconcile_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=OPTIMISTIC_RECONCILE_DELAY,
+            immediate=False,
+            function=self.async_refresh,
+        )
 
     @property
     def consecutive_failures(self) -> int:
@@ -124,6 +140,22 @@ class ZowietekCoordinator(DataUpdateCoordinator[ZowietekData]):
         # Fallback to config entry title
         return self.config_entry.title
 
+    @callback
+    def async_schedule_reconcile(self) -> None:
+        """Schedule a delayed refresh to pick up the effect of a command.
+
+        Entities that patch coordinator data after a command, and service
+        handlers that change device settings, call this so the device is
+        re-polled once things settle. Repeated calls within the reconcile
+        window collapse into a single refresh.
+        """
+        self._reconcile_debouncer.async_schedule_call()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any pending reconcile refresh and shut down the coordinator."""
+        await super().async_shutdown()
+        self._reconcile_debouncer.async_shutdown()
+
     def _get_ha_device_id(self) -> str | None:
         """Get the Home Assistant device ID for this device.
 
@@ -148,18 +180,15 @@ class ZowietekCoordinator(DataUpdateCoordinator[ZowietekData]):
         stream_data = data.stream
 
         # Check NDI
-        ndi_switch = stream_data.get("ndi_switch")
-        if ndi_switch is not None and str(ndi_switch) == "1":
+        if stream_data.get("ndi_switch") in ON_VALUES:
             return True
 
-        # Check RTMP and SRT in publish list
+        # Check RTMP and SRT in publish list (entries filtered to dicts on refresh)
         publish_list = stream_data.get("publish")
         if isinstance(publish_list, list):
             for entry in publish_list:
-                if isinstance(entry, dict):
-                    switch = entry.get("switch")
-                    if switch is not None and str(switch) == "1":
-                        return True
+                if entry.get("switch") in ON_VALUES:
+                    return True
 
         return False
 
@@ -179,10 +208,7 @@ class ZowietekCoordinator(DataUpdateCoordinator[ZowietekData]):
         if signal is None:
             signal = video_data.get("input_hdmi_signal")
 
-        if signal is None:
-            return False
-
-        return str(signal) == "1"
+        return signal in ON_VALUES
 
     def _fire_trigger_event(self, trigger_type: str) -> None:
         """Fire a device trigger event.
@@ -459,6 +485,18 @@ class ZowietekCoordinator(DataUpdateCoordinator[ZowietekData]):
                 stream_data["ndi_groups"] = ndi_config.get("groups", "")
                 stream_data["ndi_activated"] = ndi_config.get("activate", 0)
 
+            # Drop malformed publish entries and index the rest by protocol once
+            # per refresh, so readers neither re-check nor scan the list
+            publish_by_type: dict[str, dict[str, str | int]] = {}
+            publish_list = stream_data.get("publish")
+            if isinstance(publish_list, list):
+                publish_entries = [entry for entry in publish_list if isinstance(entry, dict)]
+                stream_data["publish"] = publish_entries
+                for entry in publish_entries:
+                    publish_type = entry.get("type")
+                    if isinstance(publish_type, str):
+                        publish_by_type.setdefault(publish_type, entry)
+
             # Build system data from sys_attr (preferred) or fall back to NDI config
             system_data: dict[str, str | int] = {}
             if sys_attr:
@@ -513,7 +551,10 @@ class ZowietekCoordinator(DataUpdateCoordinator[ZowietekData]):
             if streamplay_info:
                 streamplay_list = streamplay_info.get("streamplay", [])
                 if isinstance(streamplay_list, list):
-                    streamplay_data["sources"] = streamplay_list
+                    # Drop malformed entries once so consumers can assume dicts
+                    streamplay_data["sources"] = [
+                        entry for entry in streamplay_list if isinstance(entry, dict)
+                    ]
                 else:
                     streamplay_data["sources"] = []
             else:
@@ -522,7 +563,15 @@ class ZowietekCoordinator(DataUpdateCoordinator[ZowietekData]):
             # Build decoder status data
             decoder_status_data: dict[str, str | int] = {}
             if decoder_status:
-                decoder_status_data["state"] = decoder_status.get("decoder_state", 0)
+                # Normalise to int so entities can compare without coercing
+                decoder_state = decoder_status.get("decoder_state", 0)
+                decoder_status_data["state"] = (
+                    decoder_state
+                    if isinstance(decoder_state, int)
+                    else int(decoder_state)
+                    if str(decoder_state).isdigit()
+                    else 0
+                )
                 decoder_status_data["active_source"] = decoder_status.get("active_source", "")
                 decoder_status_data["active_index"] = decoder_status.get("active_index", -1)
                 decoder_status_data["width"] = decoder_status.get("width", 0)
@@ -535,7 +584,7 @@ class ZowietekCoordinator(DataUpdateCoordinator[ZowietekData]):
             if ndi_sources:
                 sources = ndi_sources.get("ndi_sources", [])
                 if isinstance(sources, list):
-                    ndi_sources_list = sources
+                    ndi_sources_list = [entry for entry in sources if isinstance(entry, dict)]
 
             # Build run status data (power state: running vs standby)
             run_status_data: dict[str, int] = {}
@@ -557,6 +606,7 @@ class ZowietekCoordinator(DataUpdateCoordinator[ZowietekData]):
                 decoder_status=decoder_status_data,
                 ndi_sources=ndi_sources_list,
                 run_status=run_status_data,
+                publish_by_type=publish_by_type,
             )
 
             # Check for state changes and fire device trigger events
@@ -20,6 +20,8 @@ import aiohttp
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 
 from .const import (
+    GO2RTC_API_MAX_CONNECTIONS,
+    GO2RTC_API_TIMEOUT,
     GO2RTC_DEFAULT_API_URL,
     GO2RTC_DEFAULT_RTSP_PORT,
     GO2RTC_DOMAIN,
@@ -33,6 +35,22 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared by every go2rtc API request via the helper's session
+_GO2RTC_TIMEOUT = aiohttp.ClientTimeout(total=GO2RTC_API_TIMEOUT)
+
+
+def _stream_name_for(source_url: str) -> str:
+    """Build the go2rtc stream name for a source URL.
+
+    Args:
+        source_url: The source stream URL.
+
+    Returns:
+        The stream name, derived from a 12 character hash of the URL.
+    """
+    url_hash = hashlib.md5(source_url.encode()).hexdigest()[:12]
+    return f"{GO2RTC_STREAM_PREFIX}{url_hash}"
+
 
 @dataclass
 class ManagedStream:
@@ -71,9 +89,8 @@ class Go2rtcHelper:
         self._streams: dict[str, ManagedStream] = {}
         self._cleanup_task: asyncio.Task[None] | None = None
         self._session: aiohttp.ClientSession | None = None
-        self._api_url: str | None = None
-        self._rtsp_host: str | None = None
-        self._rtsp_port: int = GO2RTC_DEFAULT_RTSP_PORT
+        # (available, api_url, rtsp_host, rtsp_port), resolved once per helper
+        self._cached_config: tuple[bool, str, str, int] | None = None
 
     @property
     def is_available(self) -> bool:
@@ -82,56 +99,94 @@ class Go2rtcHelper:
         Returns:
             True if go2rtc integration is loaded, False otherwise.
         """
-        return GO2RTC_DOMAIN in self._hass.data
+        return self._resolve_config()[0]
 
-    def _get_go2rtc_config(self) -> tuple[str, str, int]:
-        """Get the go2rtc API URL and RTSP host/port from Home Assistant config.
+    def _resolve_config(self) -> tuple[bool, str, str, int]:
+        """Resolve go2rtc availability and connection settings.
+
+        go2rtc is an after-dependency, so its presence and configuration
+        cannot change during the lifetime of a config entry. The result is
+        therefore resolved once and cached until the helper is stopped.
 
-        Reads the go2rtc configuration from hass.data if available.
-        Falls back to default localhost values if not configured.
+        Reads the go2rtc configuration from hass.data if available. If go2rtc
+        is not loaded it is reported as unavailable. If it is loaded but its
+        config has no usable URL, the default localhost values are used.
 
         Returns:
-            Tuple of (api_url, rtsp_host, rtsp_port).
+            Tuple of (available, api_url, rtsp_host, rtsp_port).
         """
-        # Check if we have cached values
-        if self._api_url is not None and self._rtsp_host is not None:
-            _LOGGER.debug("Using cached go2rtc config: %s", self._api_url)
-            return self._api_url, self._rtsp_host, self._rtsp_port
+        if self._cached_config is not None:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Using cached go2rtc config: %s", self._cached_config[1])
+            return self._cached_config
 
         # Try to get the go2rtc config from Home Assistant's data store
         # The go2rtc integration stores a Go2RtcConfig dataclass with url and session
         go2rtc_data = self._hass.data.get(GO2RTC_DOMAIN)
+        if go2rtc_data is None:
+            _LOGGER.debug("go2rtc not loaded, using default localhost URL")
+            self._cached_config = self._default_config(available=False)
+            return self._cached_config
 
-        if go2rtc_data is not None and hasattr(go2rtc_data, "url"):
-            # User has configured go2rtc (possibly external server)
-            configured_url = go2rtc_data.url
-            _LOGGER.debug("Using go2rtc URL from HA config: %s", configured_url)
+        configured_url = getattr(go2rtc_data, "url", None)
+        if not isinstance(configured_url, str):
+            _LOGGER.debug("go2rtc config has no usable URL, using default localhost URL")
+            self._cached_config = self._default_config(available=True)
+            return self._cached_config
 
-            # Parse the URL to extract host for RTSP
-            parsed = urlparse(configured_url)
-            api_url = configured_url.rstrip("/")
-            rtsp_host = parsed.hostname or "127.0.0.1"
+        # User has configured go2rtc (possibly external server)
+        _LOGGER.debug("Using go2rtc URL from HA config: %s", configured_url)
 
-            # For external go2rtc servers, RTSP port is typically 8554 (standard)
-            # For HA-managed go2rtc, RTSP port is 18554
-            # We check if this is localhost (HA-managed) or external
-            if rtsp_host in ("127.0.0.1", "localhost", "::1"):
-                rtsp_port = GO2RTC_DEFAULT_RTSP_PORT  # 18554 for HA-managed
-            else:
-                # External server - use standard go2rtc RTSP port
-                rtsp_port = GO2RTC_EXTERNAL_RTSP_PORT
+        # Parse the URL to extract host for RTSP
+        try:
+            rtsp_host = urlparse(configured_url).hostname or "127.0.0.1"
+        except ValueError:
+            _LOGGER.debug("Invalid go2rtc URL %s, using default localhost URL", configured_url)
+            self._cached_config = self._default_config(available=True)
+            return self._cached_config
+        api_url = configured_url.rstrip("/")
+
+        # For external go2rtc servers, RTSP port is typically 8554 (standard)
+        # For HA-managed go2rtc, RTSP port is 18554
+        # We check if this is localhost (HA-managed) or external
+        if rtsp_host in ("127.0.0.1", "localhost", "::1"):
+            rtsp_port = GO2RTC_DEFAULT_RTSP_PORT  # 18554 for HA-managed
+        else:
+            # External server - use standard go2rtc RTSP port
+            rtsp_port = GO2RTC_EXTERNAL_RTSP_PORT
+
+        self._cached_config = (True, api_url, rtsp_host, rtsp_port)
+        return self._cached_config
+
+    @staticmethod
+    def _default_config(*, available: bool) -> tuple[bool, str, str, int]:
+        """Return the default localhost settings with the given verdict.
+
+        Args:
+            available: Whether go2rtc should be reported as available.
+
+        Returns:
+            Tuple of (available, api_url, rtsp_host, rtsp_port) using the defaults.
+        """
+        return (available, GO2RTC_DEFAULT_API_URL, "127.0.0.1", GO2RTC_DEFAULT_RTSP_PORT)
 
-            self._api_url = api_url
-            self._rtsp_host = rtsp_host
-            self._rtsp_port = rtsp_port
-            return api_url, rtsp_host, rtsp_port
+    def invalidate_availability(self) -> None:
+        """Discard the cached go2rtc availability and configuration.
+
+        The next availability check re-reads hass.data. This covers the
+        case where go2rtc is loaded or reconfigured without reloading this
+        integration.
+        """
+        self._cached_config = None
+
+    def _get_go2rtc_config(self) -> tuple[str, str, int]:
+        """Get the go2rtc API URL and RTSP host/port from Home Assistant config.
 
-        # Fall back to default HA-managed localhost values
-        _LOGGER.debug("Using default go2rtc localhost URL")
-        self._api_url = GO2RTC_DEFAULT_API_URL
-        self._rtsp_host = "127.0.0.1"
-        self._rtsp_port = GO2RTC_DEFAULT_RTSP_PORT
-        return self._api_url, self._rtsp_host, self._rtsp_port
+        Returns:
+            Tuple of (api_url, rtsp_host, rtsp_port).
+        """
+        _, api_url, rtsp_host, rtsp_port = self._resolve_config()
+        return api_url, rtsp_host, rtsp_port
 
     def _get_ha_host(self) -> str:
         """Get the Home Assistant host address for external access.
@@ -201,6 +256,8 @@ class Go2rtcHelper:
             await self._session.close()
             self._session = None
 
+        self.invalidate_availability()
+
     async def async_convert_stream(self, source_url: str) -> str | None:
         """Convert a stream URL via go2rtc and return the RTSP URL.
 
@@ -212,22 +269,16 @@ class Go2rtcHelper:
         Returns:
             The RTSP URL for the converted stream, or None if conversion failed.
         """
-        if not self.is_available:
+        available, _, rtsp_host, rtsp_port = self._resolve_config()
+        if not available:
             _LOGGER.debug("go2rtc not available, cannot convert stream")
             return None
 
-        # Generate unique stream name from URL hash (12 chars for better uniqueness)
-        url_hash = hashlib.md5(source_url.encode()).hexdigest()[:12]
-        stream_name = f"{GO2RTC_STREAM_PREFIX}{url_hash}"
+        stream_name = _stream_name_for(source_url)
 
         # Check if already converted (cache hit)
-        if stream_name in self._streams:
-            self._streams[stream_name].last_accessed = datetime.now()
-            _LOGGER.debug("Reusing cached stream: %s", stream_name)
-            return self._streams[stream_name].rtsp_url
-
-        # Get go2rtc configuration (API URL and RTSP host/port)
-        _, rtsp_host, rtsp_port = self._get_go2rtc_config()
+        if (cached_url := self._get_cached_stream(stream_name)) is not None:
+            return cached_url
 
         # Add stream to go2rtc
         try:
@@ -271,6 +322,14 @@ class Go2rtcHelper:
         Returns:
             The RTSP URL for the converted camera stream, or None if conversion failed.
         """
+        # Use go2rtc's ffmpeg source format for Home Assistant cameras
+        source_url = f"ffmpeg:{entity_id}"
+
+        # An already converted camera needs no availability or entity checks
+        cached_url = self._get_cached_stream(_stream_name_for(source_url))
+        if cached_url is not None:
+            return cached_url
+
         if not self.is_available:
             _LOGGER.debug("go2rtc not available, cannot convert camera")
             return None
@@ -281,10 +340,26 @@ class Go2rtcHelper:
             _LOGGER.error("Camera entity not found: %s", entity_id)
             return None
 
-        # Use go2rtc's ffmpeg source format for Home Assistant cameras
-        source_url = f"ffmpeg:{entity_id}"
         return await self.async_convert_stream(source_url)
 
+    def _get_cached_stream(self, stream_name: str) -> str | None:
+        """Return the RTSP URL of a managed stream and mark it as accessed.
+
+        Args:
+            stream_name: The go2rtc stream name.
+
+        Returns:
+            The cached RTSP URL, or None if the stream is not managed.
+        """
+        stream = self._streams.get(stream_name)
+        if stream is None:
+            return None
+
+        stream.last_accessed = datetime.now()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Reusing cached stream: %s", stream_name)
+        return stream.rtsp_url
+
     async def _add_stream(self, name: str, source: str) -> None:
         """Add a stream to go2rtc via REST API.
 
@@ -296,16 +371,17 @@ class Go2rtcHelper:
             RuntimeError: If the go2rtc API returns an error.
         """
         if self._session is None:
-            self._session = aiohttp.ClientSession()
+            # All requests target the same go2rtc server, so keep a small pool
+            # of persistent keep-alive connections rather than one per request
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=GO2RTC_API_MAX_CONNECTIONS),
+                timeout=_GO2RTC_TIMEOUT,
+            )
 
         api_url, _, _ = self._get_go2rtc_config()
         url = f"{api_url}/api/streams"
 
-        async with self._session.put(
-            url,
-            params={"src": source, "name": name},
-            timeout=aiohttp.ClientTimeout(total=10),
-        ) as resp:
+        async with self._session.put(url, params={"src": source, "name": name}) as resp:
             if resp.status != 200:
                 text = await resp.text()
                 raise RuntimeError(f"go2rtc API error: {resp.status} - {text}")
@@ -323,11 +399,7 @@ class Go2rtcHelper:
         url = f"{api_url}/api/streams"
 
         try:
-            async with self._session.delete(
-                url,
-                params={"src": name},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
+            async with self._session.delete(url, params={"src": name}) as resp:
                 # 404 is acceptable (stream may not exist)
                 if resp.status not in (200, 404):
                     _LOGGER.warning("Failed to delete stream %s: status %s", name, resp.status)
@@ -345,21 +417,23 @@ class Go2rtcHelper:
 
     async def _cleanup_inactive_streams(self) -> None:
         """Remove streams that haven't been accessed within the TTL period."""
-        now = datetime.now()
-        ttl = timedelta(seconds=GO2RTC_STREAM_TTL)
+        # Compute the cutoff once rather than a timedelta per stream
+        ttl_cutoff = datetime.now() - timedelta(seconds=GO2RTC_STREAM_TTL)
 
         to_remove = [
-            name for name, stream in self._streams.items() if now - stream.last_accessed > ttl
+            name for name, stream in self._streams.items() if stream.last_accessed < ttl_cutoff
         ]
 
         for name in to_remove:
             await self._delete_stream(name)
-            del self._streams[name]
-            _LOGGER.debug("Cleaned up inactive stream: %s", name)
+            # The stream may have been removed while the delete was awaited
+            self._streams.pop(name, None)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Cleaned up inactive stream: %s", name)
 
     async def _cleanup_all_streams(self) -> None:
         """Remove all managed streams from go2rtc."""
-        for name in list(self._streams.keys()):
+        for name in tuple(self._streams):
             await self._delete_stream(name)
-        self._streams.clear()
+            self._streams.pop(name, None)
         _LOGGER.debug("Cleaned up all managed streams")
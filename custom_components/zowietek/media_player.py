@@ -7,17 +7,20 @@ It allows selecting and playing stream sources, including RTSP, RTMP, SRT, and N
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from homeassistant.components.media_player import (
     MediaPlayerEntity,
     MediaPlayerEntityFeature,
     MediaPlayerState,
 )
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 
 from . import ZowietekConfigEntry
+from .const import ON_VALUES
 from .coordinator import ZowietekCoordinator
 from .entity import ZowietekEntity
 from .exceptions import ZowietekApiError
@@ -27,11 +30,87 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .go2rtc_helper import Go2rtcHelper
+    from .models import ZowietekData
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+# Prefix for NDI sources in the source list
+NDI_SOURCE_PREFIX = "NDI: "
+
+# Name for the Home Assistant managed source (used for play_media)
+HA_SOURCE_NAME = "Home Assistant"
+
+# Stream protocols that ZowieBox can handle natively (no conversion needed)
+NATIVE_PROTOCOLS = ("rtsp://", "rtmp://", "srt://")
+
+# Streaming manifest extensions that need go2rtc conversion
+STREAMING_MANIFEST_EXTENSIONS = (".m3u8", ".mpd")
+
+# ZowieBox stream types keyed by URL scheme (1=RTSP, 2=RTMP, 3=SRT)
+STREAM_TYPE_RTSP = 1
+STREAM_TYPES_BY_SCHEME = {"rtsp": STREAM_TYPE_RTSP, "rtmp": 2, "srt": 3}
+
+
+@lru_cache(maxsize=256)
+def _classify_url(url: str) -> tuple[bool, int]:
+    """Classify a media URL for playback on the ZowieBox.
+
+    The result depends only on the URL, so it is cached: dashboards and
+    scripts tend to replay the same camera or stream URLs.
+
+    Args:
+        url: The media URL or camera entity ID.
+
+    Returns:
+        Tuple of (needs_go2rtc, streamtype). needs_go2rtc is False only for
+        protocols ZowieBox plays natively. streamtype is the ZowieBox stream
+        type (1=RTSP, 2=RTMP, 3=SRT), defaulting to RTSP since converted
+        streams are served over RTSP by go2rtc.
+    """
+    # Camera entity reference - always needs conversion
+    if url.startswith("camera."):
+        return True, STREAM_TYPE_RTSP
+
+    # ZowieBox only natively supports RTSP, RTMP, and SRT protocols.
+    # Everything else (HLS, DASH, TS, plain HTTP, unknown schemes) is
+    # handed to go2rtc. Schemes are almost always lowercase already, so
+    # only fall back to lowercasing the scheme when the direct lookup misses.
+    scheme, sep, _ = url.partition("://")
+    if not sep:
+        return True, STREAM_TYPE_RTSP
+    streamtype = STREAM_TYPES_BY_SCHEME.get(scheme)
+    if streamtype is None:
+        streamtype = STREAM_TYPES_BY_SCHEME.get(scheme.lower())
+    if streamtype is None:
+        return True, STREAM_TYPE_RTSP
+    return False, streamtype
+
+
+class MediaClassification(NamedTuple):
+    """How a play_media request should be routed."""
+
+    is_camera: bool
+    needs_go2rtc: bool
+    streamtype: int
+
+
+def _classify_media(media_type: str, media_id: str) -> MediaClassification:
+    """Classify a play_media request in a single pass.
+
+    Args:
+        media_type: The requested media type (e.g., "url", "camera").
+        media_id: The URL or camera entity ID to play.
+
+    Returns:
+        The classification shared by every branch of play_media.
+    """
+    needs_go2rtc, streamtype = _classify_url(media_id)
+    is_camera = media_type == "camera" or (needs_go2rtc and media_id.startswith("camera."))
+    return MediaClassification(is_camera, needs_go2rtc or is_camera, streamtype)
+
+
+@dataclass(frozen=True, slots=True)
 class SourceInfo:
     """Information about a streamplay source."""
 
@@ -41,17 +120,72 @@ class SourceInfo:
     is_active: bool  # switch == 1
 
 
-# Prefix for NDI sources in the source list
-NDI_SOURCE_PREFIX = "NDI: "
+@dataclass
+class StreamplayIndex:
+    """Pre-indexed view of the streamplay and NDI sources.
 
-# Name for the Home Assistant managed source (used for play_media)
-HA_SOURCE_NAME = "Home Assistant"
+    Built in a single pass over coordinator data so that source lookups by
+    name or URL are dictionary reads instead of list scans.
 
-# Stream protocols that ZowieBox can handle natively (no conversion needed)
-NATIVE_PROTOCOLS = ("rtsp://", "rtmp://", "srt://")
+    Attributes:
+        ordered: Streamplay sources with an index, in device order.
+        by_name: Streamplay sources keyed by name (first match wins).
+        by_url: Streamplay sources keyed by URL (first match wins).
+        source_list: Source names for the UI, including prefixed NDI sources.
+    """
 
-# Streaming manifest extensions that need go2rtc conversion
-STREAMING_MANIFEST_EXTENSIONS = (".m3u8", ".mpd")
+    ordered: list[SourceInfo] = field(default_factory=list)
+    by_name: dict[str, SourceInfo] = field(default_factory=dict)
+    by_url: dict[str, SourceInfo] = field(default_factory=dict)
+    source_list: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_data(cls, data: ZowietekData | None) -> StreamplayIndex:
+        """Build the index from coordinator data.
+
+        Args:
+            data: The coordinator data, or None if unavailable.
+
+        Returns:
+            The populated index (empty if no data is available).
+        """
+        index = cls()
+        if data is None:
+            return index
+
+        # Coordinator stores streamplay list under 'sources' key and has
+        # already dropped any entries that are not dicts
+        streamplay_list = data.streamplay.get("sources", [])
+        if isinstance(streamplay_list, list):
+            for entry in streamplay_list:
+                name = entry.get("name")
+                if name:
+                    index.source_list.append(str(name))
+                source_index = entry.get("index")
+                if source_index is None:
+                    continue
+                info = SourceInfo(
+                    index=int(source_index),
+                    name=str(entry.get("name", "")),
+                    url=str(entry.get("url", "")),
+                    is_active=entry.get("switch") in ON_VALUES,
+                )
+                index.ordered.append(info)
+                if name is not None:
+                    index.by_name.setdefault(str(name), info)
+                url = entry.get("url")
+                if url is not None:
+                    index.by_url.setdefault(str(url), info)
+
+        # Add discovered NDI sources with prefix
+        ndi_sources = data.ndi_sources
+        if isinstance(ndi_sources, list):
+            for entry in ndi_sources:
+                name = entry.get("name")
+                if name:
+                    index.source_list.append(f"{NDI_SOURCE_PREFIX}{name}")
+
+        return index
 
 
 class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
@@ -81,119 +215,133 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
         """
         super().__init__(coordinator, "decoder")
         self._attr_translation_key = "decoder"
-
-    @property
-    def state(self) -> MediaPlayerState | None:
-        """Return the current state of the media player.
-
-        Returns:
-            MediaPlayerState.STANDBY if device is in standby mode,
-            MediaPlayerState.PLAYING if decoder is active,
-            MediaPlayerState.IDLE if stopped,
-            None if no data available.
+        # Source index and the streamplay/NDI objects it was built from
+        self._streamplay_index = StreamplayIndex()
+        self._sources_key: tuple[object, object] = (object(), object())
+        # Decoder values the extra state attributes were built from
+        self._attrs_key: tuple[object, ...] | None = None
+        self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute cached attributes and write the new state."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Derive the source index and entity attributes from coordinator data.
+
+        Runs once per coordinator update so state reads are plain attribute
+        lookups rather than recomputations. The source index is only rebuilt
+        when the streamplay or NDI data is a different object, so optimistic
+        updates that patch decoder status in place skip it.
         """
-        if self.coordinator.data is None:
-            return None
-
-        # Check if device is in standby mode first
-        run_status = self.coordinator.data.run_status
-        # run_status: 0 = standby, 1 = running
-        if run_status.get("status", 1) == 0:
-            return MediaPlayerState.STANDBY
-
-        decoder_status = self.coordinator.data.decoder_status
-        # Coordinator stores decoder state under 'state' key
-        decoder_state = decoder_status.get("state", 0)
+        data = self.coordinator.data
+        sources_key: tuple[object, object] = (
+            (data.streamplay, data.ndi_sources) if data is not None else (None, None)
+        )
+        cached_key = self._sources_key
+        if sources_key[0] is not cached_key[0] or sources_key[1] is not cached_key[1]:
+            # Holding the objects (not their ids) keeps the identity check sound
+            self._sources_key = sources_key
+            self._streamplay_index = StreamplayIndex.from_data(data)
+            self._attr_source_list = self._streamplay_index.source_list
+
+        if data is None:
+            self._attr_state = None
+            self._attr_source = None
+            self._attr_extra_state_attributes = None  # type: ignore[assignment]
+            self._attrs_key = None
+            return
 
+        decoder_status = data.decoder_status
+        # Coordinator normalises decoder state to an int under 'state'
         # decoder_state: 1 = playing, 0 = idle/stopped
-        if str(decoder_state) == "1":
-            return MediaPlayerState.PLAYING
-        return MediaPlayerState.IDLE
-
-    @property
-    def source_list(self) -> list[str]:
-        """Return the list of available sources.
-
-        Combines configured streamplay sources with discovered NDI sources.
-
-        Returns:
-            List of source names.
-        """
-        if self.coordinator.data is None:
-            return []
-
-        sources: list[str] = []
-
-        # Add configured streamplay sources
-        # Coordinator stores streamplay list under 'sources' key
-        streamplay_data = self.coordinator.data.streamplay
-        streamplay_list = streamplay_data.get("sources", [])
-        if isinstance(streamplay_list, list):
-            for entry in streamplay_list:
-                if isinstance(entry, dict):
-                    name = entry.get("name")
-                    if name:
-                        sources.append(str(name))
+        playing = decoder_status.get("state", 0) == 1
 
-        # Add discovered NDI sources with prefix
-        ndi_sources = self.coordinator.data.ndi_sources
-        if isinstance(ndi_sources, list):
-            for entry in ndi_sources:
-                if isinstance(entry, dict):
-                    name = entry.get("name")
-                    if name:
-                        sources.append(f"{NDI_SOURCE_PREFIX}{name}")
-
-        return sources
-
-    @property
-    def source(self) -> str | None:
-        """Return the currently selected source.
-
-        Returns:
-            The name of the active source, or None if not playing.
-        """
-        if self.coordinator.data is None:
-            return None
-
-        decoder_status = self.coordinator.data.decoder_status
-        # Coordinator stores decoder state under 'state' key
-        decoder_state = decoder_status.get("state", 0)
-
-        if str(decoder_state) != "1":
-            return None
-
-        active_source = decoder_status.get("active_source")
-        if active_source:
-            return str(active_source)
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return additional state attributes.
+        # run_status: 0 = standby, 1 = running
+        if data.run_status.get("status", 1) == 0:
+            self._attr_state = MediaPlayerState.STANDBY
+        elif playing:
+            self._attr_state = MediaPlayerState.PLAYING
+        else:
+            self._attr_state = MediaPlayerState.IDLE
 
-        Returns:
-            Dictionary containing video resolution, framerate, and bandwidth.
-        """
-        if self.coordinator.data is None:
-            return None
+        active_source = decoder_status.get("active_source") if playing else None
+        self._attr_source = str(active_source) if active_source else None
 
-        decoder_status = self.coordinator.data.decoder_status
         width = decoder_status.get("width", 0)
         height = decoder_status.get("height", 0)
         framerate = decoder_status.get("framerate", 0)
         bandwidth = decoder_status.get("bandwidth", 0)
 
-        attrs: dict[str, Any] = {}
+        # Only rebuild the attributes dict when the underlying values change
+        attrs_key = (width, height, framerate, bandwidth)
+        if attrs_key == self._attrs_key:
+            return
+        self._attrs_key = attrs_key
 
+        attrs: dict[str, Any] = {}
         if width and height:
             attrs["video_resolution"] = f"{width}x{height}"
         if framerate:
             attrs["framerate"] = framerate
         if bandwidth:
             attrs["bandwidth_kbps"] = bandwidth
+        self._attr_extra_state_attributes = attrs or None  # type: ignore[assignment]
 
-        return attrs if attrs else None
+    @callback
+    def _async_publish_optimistic(self, data: ZowietekData) -> None:
+        """Publish patched coordinator data and schedule a reconcile refresh.
+
+        Args:
+            data: The coordinator data snapshot that was patched.
+        """
+        coordinator = self.coordinator
+        coordinator.async_set_updated_data(data)
+        coordinator.async_schedule_reconcile()
+
+    @callback
+    def _optimistic_set_playing(self, active_source: str) -> None:
+        """Optimistically mark the decoder as playing a source.
+
+        Args:
+            active_source: The name of the source now playing.
+        """
+        data = self.coordinator.data
+        data.decoder_status["state"] = 1
+        data.decoder_status["active_source"] = active_source
+        self._async_publish_optimistic(data)
+
+    @callback
+    def _optimistic_set_stopped(self) -> None:
+        """Optimistically mark the decoder as stopped."""
+        data = self.coordinator.data
+        data.decoder_status["state"] = 0
+        data.decoder_status["active_source"] = ""
+        self._async_publish_optimistic(data)
+
+    @callback
+    def _optimistic_set_standby(self, standby: bool) -> None:
+        """Optimistically update the device power state.
+
+        Args:
+            standby: True if the device entered standby, False if it woke.
+        """
+        data = self.coordinator.data
+        # run_status: 0 = standby, 1 = running
+        data.run_status["status"] = 0 if standby else 1
+        self._async_publish_optimistic(data)
+
+    def _raise_if_unavailable(self) -> None:
+        """Reject commands while the device is unreachable.
+
+        Raises:
+            HomeAssistantError: If the last coordinator update failed.
+        """
+        if not self.coordinator.last_update_success:
+            raise HomeAssistantError("Device unavailable")
 
     def _find_source_index(self, source_name: str) -> int | None:
         """Find the index of a source by name.
@@ -204,21 +352,8 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
         Returns:
             The index of the source, or None if not found.
         """
-        if self.coordinator.data is None:
-            return None
-
-        # Coordinator stores streamplay list under 'sources' key
-        streamplay_data = self.coordinator.data.streamplay
-        streamplay_list = streamplay_data.get("sources", [])
-        if not isinstance(streamplay_list, list):
-            return None
-
-        for entry in streamplay_list:
-            if isinstance(entry, dict) and entry.get("name") == source_name:
-                index = entry.get("index")
-                if index is not None:
-                    return int(index)
-        return None
+        source = self._streamplay_index.by_name.get(source_name)
+        return source.index if source is not None else None
 
     async def async_select_source(self, source: str) -> None:
         """Select a playback source.
@@ -229,6 +364,8 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
         Raises:
             HomeAssistantError: If the source cannot be selected.
         """
+        self._raise_if_unavailable()
+
         try:
             # Check if it's an NDI source
             if source.startswith(NDI_SOURCE_PREFIX):
@@ -245,7 +382,7 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
             _LOGGER.error("Failed to select source %s: %s", source, err)
             raise HomeAssistantError(f"Failed to select source: {err}") from err
 
-        await self.coordinator.async_request_refresh()
+        self._optimistic_set_playing(source)
 
     async def async_media_stop(self) -> None:
         """Stop playback.
@@ -253,65 +390,44 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
         Raises:
             HomeAssistantError: If playback cannot be stopped.
         """
+        self._raise_if_unavailable()
+
         try:
             await self.coordinator.client.async_stop_streamplay()
         except ZowietekApiError as err:
             _LOGGER.error("Failed to stop playback: %s", err)
             raise HomeAssistantError(f"Failed to stop playback: {err}") from err
 
-        await self.coordinator.async_request_refresh()
+        self._optimistic_set_stopped()
 
     async def async_media_play(self) -> None:
         """Start playback.
 
-        If idle, selects the first available source to start playback.
+        Resumes the enabled source if there is one, otherwise selects the
+        first configured source.
 
         Raises:
             HomeAssistantError: If playback cannot be started.
         """
+        self._raise_if_unavailable()
+
         if self.coordinator.data is None:
             return
 
-        # Find the first enabled source and play it
-        # Coordinator stores streamplay list under 'sources' key
-        streamplay_data = self.coordinator.data.streamplay
-        streamplay_list = streamplay_data.get("sources", [])
-        if not isinstance(streamplay_list, list) or not streamplay_list:
+        ordered = self._streamplay_index.ordered
+        if not ordered:
             _LOGGER.warning("No sources available to play")
             return
 
-        # Find the first source (prefer enabled ones)
-        first_index: int | None = None
-        for entry in streamplay_list:
-            if isinstance(entry, dict):
-                index = entry.get("index")
-                if index is not None:
-                    first_index = int(index)
-                    break
-
-        if first_index is not None:
-            try:
-                await self.coordinator.client.async_select_streamplay_source(first_index)
-            except ZowietekApiError as err:
-                _LOGGER.error("Failed to start playback: %s", err)
-                raise HomeAssistantError(f"Failed to start playback: {err}") from err
-
-            await self.coordinator.async_request_refresh()
-
-    def _get_streamplay_list(self) -> list[dict[str, Any]]:
-        """Get the list of streamplay sources.
-
-        Returns:
-            List of source dictionaries, or empty list if unavailable.
-        """
-        if self.coordinator.data is None:
-            return []
+        # Prefer the enabled source, falling back to the first in device order
+        target = next((source for source in ordered if source.is_active), ordered[0])
+        try:
+            await self.coordinator.client.async_select_streamplay_source(target.index)
+        except ZowietekApiError as err:
+            _LOGGER.error("Failed to start playback: %s", err)
+            raise HomeAssistantError(f"Failed to start playback: {err}") from err
 
-        streamplay_data = self.coordinator.data.streamplay
-        streamplay_list = streamplay_data.get("sources", [])
-        if not isinstance(streamplay_list, list):
-            return []
-        return streamplay_list
+        self._optimistic_set_playing(target.name)
 
     def _find_ha_source(self) -> SourceInfo | None:
         """Find the Home Assistant managed source.
@@ -319,17 +435,7 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
         Returns:
             SourceInfo for the HA source, or None if not found.
         """
-        for entry in self._get_streamplay_list():
-            if isinstance(entry, dict) and entry.get("name") == HA_SOURCE_NAME:
-                index = entry.get("index")
-                if index is not None:
-                    return SourceInfo(
-                        index=int(index),
-                        name=str(entry.get("name", "")),
-                        url=str(entry.get("url", "")),
-                        is_active=entry.get("switch") == 1,
-                    )
-        return None
+        return self._streamplay_index.by_name.get(HA_SOURCE_NAME)
 
     def _find_ha_source_index(self) -> int | None:
         """Find the index of the Home Assistant managed source.
@@ -337,8 +443,7 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
         Returns:
             The index of the HA source, or None if not found.
         """
-        source = self._find_ha_source()
-        return source.index if source else None
+        return self._find_source_index(HA_SOURCE_NAME)
 
     def _find_source_by_url(self, url: str) -> SourceInfo | None:
         """Find a source by its URL.
@@ -349,45 +454,7 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
         Returns:
             SourceInfo for the matching source, or None if not found.
         """
-        for entry in self._get_streamplay_list():
-            if isinstance(entry, dict) and entry.get("url") == url:
-                index = entry.get("index")
-                if index is not None:
-                    return SourceInfo(
-                        index=int(index),
-                        name=str(entry.get("name", "")),
-                        url=str(entry.get("url", "")),
-                        is_active=entry.get("switch") == 1,
-                    )
-        return None
-
-    def _needs_go2rtc_conversion(self, url: str) -> bool:
-        """Determine if a URL needs conversion via go2rtc.
-
-        Args:
-            url: The media URL to check.
-
-        Returns:
-            True if the URL needs go2rtc conversion, False if ZowieBox can handle it natively.
-        """
-        url_lower = url.lower()
-
-        # Camera entity reference - always needs conversion
-        if url.startswith("camera."):
-            return True
-
-        # Already compatible protocols - no conversion needed
-        if any(url_lower.startswith(proto) for proto in NATIVE_PROTOCOLS):
-            return False
-
-        # HTTP/HTTPS URLs always need conversion
-        # ZowieBox only natively supports RTSP, RTMP, and SRT protocols
-        # All HTTP-based streams (HLS, DASH, TS, plain HTTP) require go2rtc
-        if url_lower.startswith(("http://", "https://")):
-            return True
-
-        # Unknown protocol - try conversion if go2rtc available
-        return True
+        return self._streamplay_index.by_url.get(url)
 
     def _is_go2rtc_available(self) -> bool:
         """Check if go2rtc is available and enabled.
@@ -395,10 +462,7 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
         Returns:
             True if go2rtc helper is available and enabled, False otherwise.
         """
-        return (
-            getattr(self.coordinator, "go2rtc_enabled", False)
-            and getattr(self.coordinator, "go2rtc_helper", None) is not None
-        )
+        return self.coordinator.go2rtc_enabled and self.coordinator.go2rtc_helper is not None
 
     def _get_go2rtc_helper(self) -> Go2rtcHelper | None:
         """Get the go2rtc helper if available.
@@ -406,9 +470,9 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
         Returns:
             The go2rtc helper instance, or None if not available.
         """
-        if not self._is_go2rtc_available():
+        if not self.coordinator.go2rtc_enabled:
             return None
-        return getattr(self.coordinator, "go2rtc_helper", None)
+        return self.coordinator.go2rtc_helper
 
     async def async_play_media(
         self,
@@ -434,12 +498,13 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
         Raises:
             HomeAssistantError: If the media cannot be played.
         """
-        url_to_play = media_id
+        self._raise_if_unavailable()
 
-        # Handle camera entity type or camera.* media_id
-        is_camera = media_type == "camera" or media_id.startswith("camera.")
+        url_to_play = media_id
+        media = _classify_media(media_type, media_id)
+        streamtype = media.streamtype
 
-        if is_camera:
+        if media.is_camera:
             # Camera entities always require go2rtc conversion
             entity_id = media_id
             go2rtc_helper = self._get_go2rtc_helper()
@@ -459,8 +524,9 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
                     f"Check go2rtc logs for details."
                 )
             url_to_play = converted_url
+            streamtype = STREAM_TYPE_RTSP
 
-        elif self._needs_go2rtc_conversion(media_id):
+        elif media.needs_go2rtc:
             # URL needs conversion (HTTP/HTTPS URLs require go2rtc)
             # ZowieBox only natively supports RTSP, RTMP, and SRT protocols
             go2rtc_helper = self._get_go2rtc_helper()
@@ -469,7 +535,11 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
                 converted_url = await go2rtc_helper.async_convert_stream(media_id)
                 if converted_url is not None:
                     url_to_play = converted_url
-                    _LOGGER.debug("Converted stream via go2rtc: %s -> %s", media_id, url_to_play)
+                    streamtype = STREAM_TYPE_RTSP
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "Converted stream via go2rtc: %s -> %s", media_id, url_to_play
+                        )
                 else:
                     raise HomeAssistantError(
                         f"go2rtc conversion failed for {media_id}. "
@@ -484,52 +554,42 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
                     f"URL: {media_id}"
                 )
 
+        client = self.coordinator.client
         try:
             # Check if this URL already exists as a configured source
             existing_source = self._find_source_by_url(url_to_play)
             if existing_source is not None:
                 # URL already exists as a source
                 if existing_source.is_active:
-                    # Source is already ON - turn OFF then ON to force reload
-                    _LOGGER.debug(
-                        "Source %s is active, cycling off/on to reload",
-                        existing_source.name,
-                    )
-                    await self.coordinator.client.async_disable_streamplay_source(
-                        existing_source.index
-                    )
-                # Turn the source ON (whether it was already on or not)
-                await self.coordinator.client.async_select_streamplay_source(existing_source.index)
-                await self.coordinator.async_request_refresh()
+                    # Source is already ON - cycle it to force a reload
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "Source %s is active, cycling off/on to reload",
+                            existing_source.name,
+                        )
+                    await client.async_reload_streamplay_source(existing_source.index)
+                else:
+                    await client.async_select_streamplay_source(existing_source.index)
+                self._optimistic_set_playing(existing_source.name)
                 return
 
             # URL doesn't match any existing source - use HA managed source
-            # Determine stream type from URL
-            streamtype = self._get_stream_type(url_to_play)
-
             # Check if we already have a "Home Assistant" source
             ha_source = self._find_ha_source()
 
             if ha_source is not None:
-                # HA source exists - need to handle properly
-                if ha_source.is_active:
-                    # Source is ON - turn OFF first, then update, then turn ON
-                    _LOGGER.debug("HA source is active, turning off before update")
-                    await self.coordinator.client.async_disable_streamplay_source(ha_source.index)
-
-                # Update the URL (switch=False, we'll turn on explicitly after)
-                await self.coordinator.client.async_modify_decoding_url(
+                # HA source exists - repoint it (turning it off first if it
+                # is active) and turn it back on to force a reload
+                await client.async_replace_decoding_url(
                     index=ha_source.index,
                     name=HA_SOURCE_NAME,
                     url=url_to_play,
                     streamtype=streamtype,
-                    switch=False,
+                    active=ha_source.is_active,
                 )
-                # Now turn it ON
-                await self.coordinator.client.async_select_streamplay_source(ha_source.index)
             else:
                 # Create new "Home Assistant" source (created with switch=1)
-                await self.coordinator.client.async_add_decoding_url(
+                await client.async_add_decoding_url(
                     name=HA_SOURCE_NAME,
                     url=url_to_play,
                     streamtype=streamtype,
@@ -539,25 +599,10 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
             _LOGGER.error("Failed to play media %s: %s", url_to_play, err)
             raise HomeAssistantError(f"Failed to play media: {err}") from err
 
-        await self.coordinator.async_request_refresh()
-
-    def _get_stream_type(self, url: str) -> int:
-        """Determine the ZowieBox stream type from a URL.
-
-        Args:
-            url: The stream URL.
-
-        Returns:
-            Stream type integer (1=RTSP, 2=RTMP, 3=SRT, 4=HTTP).
-        """
-        url_lower = url.lower()
-        if url_lower.startswith("rtmp://"):
-            return 2
-        if url_lower.startswith("srt://"):
-            return 3
-        # Default to RTSP (HTTP/HTTPS URLs are converted to RTSP via go2rtc
-        # before reaching this method, so they will also return 1)
-        return 1
+        # Adding or repointing the HA source changes the source list, so fetch
+        # the real state now instead of publishing an optimistic one; a
+        # follow-up play_media would otherwise match against the stale index
+        await self.coordinator.async_refresh()
 
     async def async_turn_off(self) -> None:
         """Put the device into standby mode.
@@ -568,13 +613,15 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
         Raises:
             HomeAssistantError: If the device cannot be put into standby.
         """
+        self._raise_if_unavailable()
+
         try:
             await self.coordinator.client.async_power_off()
         except ZowietekApiError as err:
             _LOGGER.error("Failed to put device into standby: %s", err)
             raise HomeAssistantError(f"Failed to put device into standby: {err}") from err
 
-        await self.coordinator.async_request_refresh()
+        self._optimistic_set_standby(True)
 
     async def async_turn_on(self) -> None:
         """Wake the device from standby mode.
@@ -584,13 +631,15 @@ class ZowietekMediaPlayer(ZowietekEntity, MediaPlayerEntity):
         Raises:
             HomeAssistantError: If the device cannot be woken.
         """
+        self._raise_if_unavailable()
+
         try:
             await self.coordinator.client.async_power_on()
         except ZowietekApiError as err:
             _LOGGER.error("Failed to wake device: %s", err)
             raise HomeAssistantError(f"Failed to wake device: {err}") from err
 
-        await self.coordinator.async_request_refresh()
+        self._optimistic_set_standby(False)
 
 
 async def async_setup_entry(
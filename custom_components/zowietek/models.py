@@ -10,7 +10,7 @@ required vs optional keys (NotRequired). The PEP 563 deferred evaluation makes
 all annotations ForwardRef strings, which breaks TypedDict's introspection.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import NotRequired, TypedDict
 
 
@@ -274,7 +274,7 @@ class ZowietekRunStatus(TypedDict):
     run_status: NotRequired[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class ZowietekData:
     """Container for all ZowieBox device data.
 
@@ -293,3 +293,9 @@ class ZowietekData:
     decoder_status: dict[str, str | int]
     ndi_sources: list[dict[str, str | int]]
     run_status: dict[str, int]
+    publish_by_type: dict[str, dict[str, str | int]] = field(default_factory=dict)
+    """Entries of stream["publish"] keyed by protocol type (e.g. "rtmp").
+
+    Built once per refresh so entities look up a protocol directly instead
+    of scanning the publish list. The first entry of each type wins.
+    """
@@ -20,11 +20,18 @@ from .entity import ZowietekEntity
 from .exceptions import ZowietekApiError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .models import ZowietekData
+
 _LOGGER = logging.getLogger(__name__)
 
+# The device reports and accepts bitrates in bps; the entity works in Mbps
+BPS_PER_MBPS = 1_000_000
+
 
 @dataclass(frozen=True, kw_only=True)
 class ZowietekNumberEntityDescription(NumberEntityDescription):  # type: ignore[override]
@@ -88,6 +95,11 @@ class ZowietekNumber(ZowietekEntity, NumberEntity):
         """
         super().__init__(coordinator, description.key)
         self.entity_description = description
+        # Bind the reader for this number type once; unknown types read None
+        self._read_value: Callable[[ZowietekData], float | None] | None = {
+            "audio_volume": self._get_audio_volume_value,
+            "stream_bitrate": self._get_stream_bitrate_value,
+        }.get(description.number_type)
 
     @property
     def native_value(self) -> float | None:
@@ -96,44 +108,43 @@ class ZowietekNumber(ZowietekEntity, NumberEntity):
         Returns:
             The current value, or None if not available.
         """
-        if self.coordinator.data is None:
+        read_value = self._read_value
+        data = self.coordinator.data
+        if read_value is None or data is None:
             return None
 
-        number_type = self.entity_description.number_type
-
-        if number_type == "audio_volume":
-            return self._get_audio_volume_value()
-        if number_type == "stream_bitrate":
-            return self._get_stream_bitrate_value()
+        return read_value(data)
 
-        return None
-
-    def _get_audio_volume_value(self) -> float | None:
+    def _get_audio_volume_value(self, data: ZowietekData) -> float | None:
         """Get the current audio volume value.
 
+        Args:
+            data: The current coordinator data.
+
         Returns:
             The current volume (0-100), or None if not available.
         """
-        audio_data = self.coordinator.data.audio
-        volume = audio_data.get("volume")
+        volume = data.audio.get("volume")
 
         if volume is not None and isinstance(volume, int | float):
             return float(volume)
 
         return None
 
-    def _get_stream_bitrate_value(self) -> float | None:
+    def _get_stream_bitrate_value(self, data: ZowietekData) -> float | None:
         """Get the current stream bitrate value in Mbps.
 
+        Args:
+            data: The current coordinator data.
+
         Returns:
             The current bitrate in Mbps, or None if not available.
         """
-        video_data = self.coordinator.data.video
-        bitrate = video_data.get("enc_bitrate")
+        bitrate = data.video.get("enc_bitrate")
 
         if bitrate is not None and isinstance(bitrate, int | float):
             # Convert from bps to Mbps
-            return float(bitrate) / 1_000_000
+            return bitrate / BPS_PER_MBPS
 
         return None
 
@@ -179,8 +190,9 @@ class ZowietekNumber(ZowietekEntity, NumberEntity):
         Raises:
             ZowietekApiError: If the API call fails.
         """
-        # Convert from Mbps to bps
-        bitrate_bps = int(value * 1_000_000)
+        # Convert from Mbps to bps, rounding so e.g. 4.1 Mbps is not
+        # truncated to 4099999 bps by float error
+        bitrate_bps = round(value * BPS_PER_MBPS)
         await self.coordinator.client.async_set_encoder_bitrate(bitrate_bps)
 
 
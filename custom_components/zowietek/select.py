@@ -18,19 +18,24 @@ from .entity import ZowietekEntity
 from .exceptions import ZowietekApiError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .models import ZowietekData
+
 _LOGGER = logging.getLogger(__name__)
 
 # Default output format options for fallback
-DEFAULT_OUTPUT_FORMATS: list[str] = [
+DEFAULT_OUTPUT_FORMATS: tuple[str, ...] = (
     "720p50",
     "720p60",
     "1080p50",
     "1080p60",
     "2160p30",
-]
+)
+_DEFAULT_OUTPUT_FORMAT_SET = frozenset(DEFAULT_OUTPUT_FORMATS)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -85,6 +90,18 @@ class ZowietekSelect(ZowietekEntity, SelectEntity):
         """
         super().__init__(coordinator, description.key)
         self.entity_description = description
+        # Bind the readers for this select type once; unknown types read
+        # no current option and no options
+        readers: dict[
+            str,
+            tuple[Callable[[ZowietekData], str | None], Callable[[ZowietekData], list[str]]],
+        ] = {
+            "encoder_type": (self._get_encoder_type_option, self._get_encoder_type_options),
+            "output_format": (self._get_output_format_option, self._get_output_format_options),
+        }
+        bound = readers.get(description.select_type)
+        self._read_option: Callable[[ZowietekData], str | None] | None = bound[0] if bound else None
+        self._read_options: Callable[[ZowietekData], list[str]] | None = bound[1] if bound else None
 
     @property
     def current_option(self) -> str | None:
@@ -93,25 +110,23 @@ class ZowietekSelect(ZowietekEntity, SelectEntity):
         Returns:
             The current option value, or None if not available.
         """
-        if self.coordinator.data is None:
+        read_option = self._read_option
+        data = self.coordinator.data
+        if read_option is None or data is None:
             return None
 
-        select_type = self.entity_description.select_type
-
-        if select_type == "encoder_type":
-            return self._get_encoder_type_option()
-        if select_type == "output_format":
-            return self._get_output_format_option()
-
-        return None
+        return read_option(data)
 
-    def _get_encoder_type_option(self) -> str | None:
+    def _get_encoder_type_option(self, data: ZowietekData) -> str | None:
         """Get the current encoder type option.
 
+        Args:
+            data: The current coordinator data.
+
         Returns:
             The current codec name, or None if not available.
         """
-        video_data = self.coordinator.data.video
+        video_data = data.video
         codec_list = video_data.get("codec_list")
         codec_selected_id = video_data.get("codec_selected_id")
 
@@ -126,13 +141,16 @@ class ZowietekSelect(ZowietekEntity, SelectEntity):
 
         return None
 
-    def _get_output_format_option(self) -> str | None:
+    def _get_output_format_option(self, data: ZowietekData) -> str | None:
         """Get the current output format option.
 
+        Args:
+            data: The current coordinator data.
+
         Returns:
             The current output format, or None if not available.
         """
-        video_data = self.coordinator.data.video
+        video_data = data.video
         output_format = video_data.get("output_format")
 
         if output_format is not None:
@@ -147,39 +165,42 @@ class ZowietekSelect(ZowietekEntity, SelectEntity):
         Returns:
             List of available option values.
         """
-        if self.coordinator.data is None:
+        read_options = self._read_options
+        data = self.coordinator.data
+        if read_options is None or data is None:
             return []
 
-        select_type = self.entity_description.select_type
-
-        if select_type == "encoder_type":
-            return self._get_encoder_type_options()
-        if select_type == "output_format":
-            return self._get_output_format_options()
+        return read_options(data)
 
-        return []
-
-    def _get_encoder_type_options(self) -> list[str]:
+    def _get_encoder_type_options(self, data: ZowietekData) -> list[str]:
         """Get the available encoder type options.
 
+        Args:
+            data: The current coordinator data.
+
         Returns:
             List of available codec names.
         """
-        video_data = self.coordinator.data.video
+        video_data = data.video
         codec_list = video_data.get("codec_list")
 
+        # The coordinator already stores codec names as strings; copy the list
+        # so callers cannot mutate coordinator state through the options
         if isinstance(codec_list, list):
-            return [str(c) for c in codec_list]
+            return list(codec_list)
 
         return []
 
-    def _get_output_format_options(self) -> list[str]:
+    def _get_output_format_options(self, data: ZowietekData) -> list[str]:
         """Get the available output format options.
 
+        Args:
+            data: The current coordinator data.
+
         Returns:
             List of available output formats.
         """
-        video_data = self.coordinator.data.video
+        video_data = data.video
         format_list = video_data.get("output_format_list")
 
         if isinstance(format_list, list) and format_list:
@@ -187,10 +208,9 @@ class ZowietekSelect(ZowietekEntity, SelectEntity):
 
         # Fallback: include current format and defaults
         current = video_data.get("output_format")
-        options = list(DEFAULT_OUTPUT_FORMATS)
-        if current and str(current) not in options:
-            options.append(str(current))
-        return options
+        if current and (current_format := str(current)) not in _DEFAULT_OUTPUT_FORMAT_SET:
+            return [*DEFAULT_OUTPUT_FORMATS, current_format]
+        return list(DEFAULT_OUTPUT_FORMATS)
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option.
@@ -203,10 +223,11 @@ class ZowietekSelect(ZowietekEntity, SelectEntity):
         """
         select_type = self.entity_description.select_type
 
-        # Validate option is in available list
-        if option not in self.options:
+        # Validate option is in available list (built once for check and message)
+        options = self.options
+        if option not in options:
             raise HomeAssistantError(
-                f"Invalid option '{option}' for {select_type}. Available options: {self.options}"
+                f"Invalid option '{option}' for {select_type}. Available options: {options}"
             )
 
         try:
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import (
@@ -18,9 +21,57 @@ from .coordinator import ZowietekCoordinator
 from .entity import ZowietekEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .models import ZowietekData
+
+# ZowietekData sections holding flat dicts that a value_key can address
+VALUE_KEY_SECTIONS = frozenset(
+    {
+        "system",
+        "video",
+        "audio",
+        "stream",
+        "network",
+        "dashboard",
+        "streamplay",
+        "decoder_status",
+        "run_status",
+    }
+)
+
+# One shared accessor per section, reused by every sensor reading from it
+_SECTION_GETTERS: dict[str, Callable[[ZowietekData], Mapping[str, object]]] = {
+    section: attrgetter(section) for section in VALUE_KEY_SECTIONS
+}
+
+
+@lru_cache(maxsize=64)
+def _resolve_value_key(
+    value_key: str,
+) -> tuple[Callable[[ZowietekData], Mapping[str, object]] | None, str]:
+    """Resolve a "section.key" value_key to a section accessor and data key.
+
+    Cached so every config entry shares the parsed accessors for the
+    module's descriptions. The data key is interned because slicing it out
+    of value_key yields a fresh string that dict lookups cannot match by
+    identity.
+
+    Args:
+        value_key: The value_key from a sensor description.
+
+    Returns:
+        Tuple of (section_getter, data_key). section_getter is None when the
+        value_key has no section or names a section that is not a flat dict.
+    """
+    section, sep, key = value_key.partition(".")
+    if not sep:
+        return None, key
+    return _SECTION_GETTERS.get(section), sys.intern(key)
+
 
 @dataclass(frozen=True, kw_only=True)
 class ZowietekSensorEntityDescription(SensorEntityDescription):  # type: ignore[override]
@@ -167,6 +218,7 @@ class ZowietekSensor(ZowietekEntity, SensorEntity):
         """
         super().__init__(coordinator, description.key)
         self.entity_description = description
+        self._section_getter, self._data_key = _resolve_value_key(description.value_key)
 
     @property
     def native_value(self) -> StateType:
@@ -178,24 +230,13 @@ class ZowietekSensor(ZowietekEntity, SensorEntity):
         Returns:
             The sensor value, or None if not available.
         """
-        # Parse value_key (format: "section.key")
-        parts = self.entity_description.value_key.split(".", 1)
-        if len(parts) != 2:
-            return None
-
-        section, key = parts
-
-        # Get the data section from coordinator
+        section_getter = self._section_getter
         data = self.coordinator.data
-        if data is None:
-            return None
-
-        section_data = getattr(data, section, None)
-        if section_data is None or not isinstance(section_data, dict):
+        if section_getter is None or data is None:
             return None
 
         # Get the value from the section
-        value = section_data.get(key)
+        value = section_getter(data).get(self._data_key)
         if value is None:
             return None
 
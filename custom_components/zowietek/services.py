@@ -3,22 +3,32 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
+from homeassistant.util.hass_dict import HassKey
 
 from .const import DOMAIN
 from .exceptions import ZowietekError
 
 if TYPE_CHECKING:
+    from .api import ZowietekClient
     from .coordinator import ZowietekCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Config entry ID resolved for each device ID, dropped when services unload
+DATA_DEVICE_ENTRY_IDS: HassKey[dict[str, str]] = HassKey(f"{DOMAIN}_device_entry_ids")
+# Unsubscribe callback for the device registry listener that prunes that cache
+DATA_DEVICE_REGISTRY_UNSUB: HassKey[CALLBACK_TYPE] = HassKey(f"{DOMAIN}_device_registry_unsub")
+
 # Service names
 SERVICE_SET_NDI_SETTINGS = "set_ndi_settings"
 SERVICE_SET_RTMP_URL = "set_rtmp_url"
@@ -63,12 +73,14 @@ SERVICE_SET_SRT_SETTINGS_SCHEMA = vol.Schema(
 
 def _get_coordinator_for_device(
     hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
     device_id: str,
 ) -> ZowietekCoordinator:
     """Get the coordinator for a device by device ID.
 
     Args:
         hass: Home Assistant instance.
+        device_registry: The device registry, bound once when services are set up.
         device_id: The device ID from the device registry.
 
     Returns:
@@ -77,7 +89,17 @@ def _get_coordinator_for_device(
     Raises:
         ServiceValidationError: If the device is not found or not a Zowietek device.
     """
-    device_registry = dr.async_get(hass)
+    # Automations often target the same device repeatedly; reuse the entry
+    # resolved last time while it is still loaded
+    entry_ids = hass.data.setdefault(DATA_DEVICE_ENTRY_IDS, {})
+    cached_entry_id = entry_ids.get(device_id)
+    if cached_entry_id is not None:
+        cached_entry = hass.config_entries.async_get_entry(cached_entry_id)
+        if cached_entry is not None and cached_entry.state is ConfigEntryState.LOADED:
+            cached_coordinator: ZowietekCoordinator = cached_entry.runtime_data
+            return cached_coordinator
+        del entry_ids[device_id]
+
     device = device_registry.async_get(device_id)
 
     if device is None:
@@ -88,20 +110,17 @@ def _get_coordinator_for_device(
             translation_placeholders={"device_id": device_id},
         )
 
-    # Find the config entry for this device
-    config_entry_id: str | None = None
-    for identifier in device.identifiers:
-        if identifier[0] == DOMAIN:
-            # Get the config entry that owns this device
-            for entry_id in device.config_entries:
-                entry = hass.config_entries.async_get_entry(entry_id)
-                if entry and entry.domain == DOMAIN:
-                    config_entry_id = entry_id
-                    break
+    # Find the Zowietek config entry that owns this device in one pass; an
+    # entry of this domain implies the device carries a Zowietek identifier
+    entry: ConfigEntry | None = None
+    for entry_id in device.config_entries:
+        candidate = hass.config_entries.async_get_entry(entry_id)
+        if candidate is not None and candidate.domain == DOMAIN:
+            entry = candidate
             break
 
-    if config_entry_id is None:  # pragma: no cover
-        # Defensive check: device exists but no Zowietek identifier found
+    if entry is None:
+        # Device exists but belongs to another integration
         raise ServiceValidationError(
             f"Device '{device_id}' is not a Zowietek device",
             translation_domain=DOMAIN,
@@ -109,9 +128,8 @@ def _get_coordinator_for_device(
             translation_placeholders={"device_id": device_id},
         )
 
-    entry = hass.config_entries.async_get_entry(config_entry_id)
-    if entry is None or not hasattr(entry, "runtime_data"):  # pragma: no cover
-        # Defensive check: config entry removed or corrupted after device lookup
+    if not hasattr(entry, "runtime_data"):  # pragma: no cover
+        # Defensive check: config entry not set up (or torn down) after device lookup
         raise ServiceValidationError(
             f"Config entry for device '{device_id}' not found",
             translation_domain=DOMAIN,
@@ -119,10 +137,94 @@ def _get_coordinator_for_device(
             translation_placeholders={"device_id": device_id},
         )
 
+    entry_ids[device_id] = entry.entry_id
     coordinator: ZowietekCoordinator = entry.runtime_data
     return coordinator
 
 
+async def _async_set_ndi_settings(client: ZowietekClient, call: ServiceCall) -> None:
+    """Send the set_ndi_settings call data to the device.
+
+    Args:
+        client: Client of the targeted device.
+        call: The service call carrying the NDI name and optional group.
+
+    Raises:
+        ZowietekError: If the device rejects the settings or cannot be reached.
+    """
+    await client.async_set_ndi_settings(name=call.data[ATTR_NAME], group=call.data.get(ATTR_GROUP))
+
+
+async def _async_set_rtmp_url(client: ZowietekClient, call: ServiceCall) -> None:
+    """Send the set_rtmp_url call data to the device.
+
+    Args:
+        client: Client of the targeted device.
+        call: The service call carrying the RTMP URL and optional stream key.
+
+    Raises:
+        ZowietekError: If the device rejects the settings or cannot be reached.
+    """
+    await client.async_set_rtmp_url(url=call.data[ATTR_URL], key=call.data.get(ATTR_KEY))
+
+
+async def _async_set_srt_settings(client: ZowietekClient, call: ServiceCall) -> None:
+    """Send the set_srt_settings call data to the device.
+
+    Args:
+        client: Client of the targeted device.
+        call: The service call carrying the SRT port, latency and passphrase.
+
+    Raises:
+        ZowietekError: If the device rejects the settings or cannot be reached.
+    """
+    await client.async_set_srt_settings(
+        port=call.data[ATTR_PORT],
+        latency=call.data.get(ATTR_LATENCY),
+        passphrase=call.data.get(ATTR_PASSPHRASE),
+    )
+
+
+async def _async_handle_settings_call(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    call: ServiceCall,
+    *,
+    apply: Callable[[ZowietekClient, ServiceCall], Awaitable[None]],
+    error_message: str,
+    translation_key: str,
+) -> None:
+    """Apply a settings service call to the targeted ZowieBox device.
+
+    Resolves the device's coordinator, hands its client and the call to
+    the service's apply function and schedules a reconcile refresh.
+
+    Args:
+        hass: Home Assistant instance.
+        device_registry: The device registry used to resolve the target device.
+        call: The service call, including the target device_id.
+        apply: Sends the call data to the device through the client.
+        error_message: Prefix for the error raised when the device rejects the call.
+        translation_key: Translation key for that error.
+
+    Raises:
+        HomeAssistantError: If the device call fails.
+    """
+    coordinator = _get_coordinator_for_device(hass, device_registry, call.data[ATTR_DEVICE_ID])
+
+    try:
+        await apply(coordinator.client, call)
+    except ZowietekError as err:
+        raise HomeAssistantError(
+            f"{error_message}: {err}",
+            translation_domain=DOMAIN,
+            translation_key=translation_key,
+        ) from err
+
+    # Coalesce refreshes when automations fire several settings at once
+    coordinator.async_schedule_reconcile()
+
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up Zowietek services.
 
@@ -130,100 +232,60 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         hass: Home Assistant instance.
     """
 
-    async def handle_set_ndi_settings(call: ServiceCall) -> None:
-        """Handle the set_ndi_settings service call.
-
-        Sets the NDI name and optionally the group for a ZowieBox device.
-
-        Args:
-            call: The service call with device_id, name, and optional group.
-        """
-        device_id: str = call.data[ATTR_DEVICE_ID]
-        name: str = call.data[ATTR_NAME]
-        group: str | None = call.data.get(ATTR_GROUP)
-
-        coordinator = _get_coordinator_for_device(hass, device_id)
-
-        try:
-            await coordinator.client.async_set_ndi_settings(name=name, group=group)
-            await coordinator.async_request_refresh()
-        except ZowietekError as err:
-            raise HomeAssistantError(
-                f"Failed to set NDI settings: {err}",
-                translation_domain=DOMAIN,
-                translation_key="ndi_settings_failed",
-            ) from err
-
-    async def handle_set_rtmp_url(call: ServiceCall) -> None:
-        """Handle the set_rtmp_url service call.
-
-        Sets the RTMP URL and optionally the stream key for a ZowieBox device.
-
-        Args:
-            call: The service call with device_id, url, and optional key.
-        """
-        device_id: str = call.data[ATTR_DEVICE_ID]
-        url: str = call.data[ATTR_URL]
-        key: str | None = call.data.get(ATTR_KEY)
-
-        coordinator = _get_coordinator_for_device(hass, device_id)
-
-        try:
-            await coordinator.client.async_set_rtmp_url(url=url, key=key)
-            await coordinator.async_request_refresh()
-        except ZowietekError as err:
-            raise HomeAssistantError(
-                f"Failed to set RTMP URL: {err}",
-                translation_domain=DOMAIN,
-                translation_key="rtmp_url_failed",
-            ) from err
-
-    async def handle_set_srt_settings(call: ServiceCall) -> None:
-        """Handle the set_srt_settings service call.
-
-        Sets SRT streaming settings including port, latency, and passphrase.
-
-        Args:
-            call: The service call with device_id, port, and optional latency/passphrase.
-        """
-        device_id: str = call.data[ATTR_DEVICE_ID]
-        port: int = call.data[ATTR_PORT]
-        latency: int | None = call.data.get(ATTR_LATENCY)
-        passphrase: str | None = call.data.get(ATTR_PASSPHRASE)
-
-        coordinator = _get_coordinator_for_device(hass, device_id)
-
-        try:
-            await coordinator.client.async_set_srt_settings(
-                port=port,
-                latency=latency,
-                passphrase=passphrase,
-            )
-            await coordinator.async_request_refresh()
-        except ZowietekError as err:
-            raise HomeAssistantError(
-                f"Failed to set SRT settings: {err}",
-                translation_domain=DOMAIN,
-                translation_key="srt_settings_failed",
-            ) from err
-
-    # Register services
+    @callback
+    def _async_device_registry_updated(
+        event: Event[dr.EventDeviceRegistryUpdatedData],
+    ) -> None:
+        """Drop the cached entry of a device that was updated or removed."""
+        entry_ids = hass.data.get(DATA_DEVICE_ENTRY_IDS)
+        if entry_ids:
+            entry_ids.pop(event.data["device_id"], None)
+
+    # The registry is a singleton for the lifetime of hass; bind it once
+    device_registry = dr.async_get(hass)
+
+    hass.data[DATA_DEVICE_REGISTRY_UNSUB] = hass.bus.async_listen(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED,
+        _async_device_registry_updated,
+    )
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_NDI_SETTINGS,
-        handle_set_ndi_settings,
+        partial(
+            _async_handle_settings_call,
+            hass,
+            device_registry,
+            apply=_async_set_ndi_settings,
+            error_message="Failed to set NDI settings",
+            translation_key="ndi_settings_failed",
+        ),
         schema=SERVICE_SET_NDI_SETTINGS_SCHEMA,
     )
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_RTMP_URL,
-        handle_set_rtmp_url,
+        partial(
+            _async_handle_settings_call,
+            hass,
+            device_registry,
+            apply=_async_set_rtmp_url,
+            error_message="Failed to set RTMP URL",
+            translation_key="rtmp_url_failed",
+        ),
         schema=SERVICE_SET_RTMP_URL_SCHEMA,
     )
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_SRT_SETTINGS,
-        handle_set_srt_settings,
+        partial(
+            _async_handle_settings_call,
+            hass,
+            device_registry,
+            apply=_async_set_srt_settings,
+            error_message="Failed to set SRT settings",
+            translation_key="srt_settings_failed",
+        ),
         schema=SERVICE_SET_SRT_SETTINGS_SCHEMA,
     )
 
@@ -239,5 +301,8 @@ async def async_unload_services(hass: HomeAssistant) -> None:
     hass.services.async_remove(DOMAIN, SERVICE_SET_NDI_SETTINGS)
     hass.services.async_remove(DOMAIN, SERVICE_SET_RTMP_URL)
     hass.services.async_remove(DOMAIN, SERVICE_SET_SRT_SETTINGS)
+    hass.data.pop(DATA_DEVICE_ENTRY_IDS, None)
+    if (unsub := hass.data.pop(DATA_DEVICE_REGISTRY_UNSUB, None)) is not None:
+        unsub()
 
     _LOGGER.debug("Unregistered Zowietek services")
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import (
@@ -13,6 +15,7 @@ from homeassistant.components.switch import (
 from homeassistant.exceptions import HomeAssistantError
 
 from . import ZowietekConfigEntry
+from .const import ON_VALUES
 from .coordinator import ZowietekCoordinator
 from .entity import ZowietekEntity
 from .exceptions import ZowietekApiError
@@ -21,6 +24,8 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .models import ZowietekData
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -83,6 +88,43 @@ class ZowietekSwitch(ZowietekEntity, SwitchEntity):
         """
         super().__init__(coordinator, description.key)
         self.entity_description = description
+        # Resolve the NDI/publish distinction once rather than on every access
+        client = coordinator.client
+        self._read_flag: Callable[[ZowietekData], object]
+        self._set_enabled: Callable[[bool], Awaitable[None]]
+        if description.stream_type == "ndi":
+            self._read_flag = self._read_ndi_flag
+            self._set_enabled = client.async_set_ndi_enabled
+        else:
+            self._read_flag = self._read_publish_flag
+            self._set_enabled = partial(client.async_set_stream_enabled, description.stream_type)
+
+    @staticmethod
+    def _read_ndi_flag(data: ZowietekData) -> object:
+        """Read the raw NDI enable flag.
+
+        Args:
+            data: The coordinator data snapshot.
+
+        Returns:
+            The 'ndi_switch' value as reported, or None if absent.
+        """
+        # Coordinator stores NDI switch under 'ndi_switch' key
+        return data.stream.get("ndi_switch")
+
+    def _read_publish_flag(self, data: ZowietekData) -> object:
+        """Read the raw enable flag of this switch's publish entry.
+
+        Args:
+            data: The coordinator data snapshot.
+
+        Returns:
+            The entry's 'switch' value as reported, or None if the stream
+            type has no publish entry.
+        """
+        # API uses 'switch' field for enabled state
+        entry = data.publish_by_type.get(self.entity_description.stream_type)
+        return None if entry is None else entry.get("switch")
 
     @property
     def is_on(self) -> bool:
@@ -94,87 +136,52 @@ class ZowietekSwitch(ZowietekEntity, SwitchEntity):
         Returns:
             True if the stream is enabled, False otherwise.
         """
-        if self.coordinator.data is None:
+        data = self.coordinator.data
+        if data is None:
             return False
+        return self._read_flag(data) in ON_VALUES
 
-        stream_type = self.entity_description.stream_type
-        stream_data = self.coordinator.data.stream
+    async def _async_set_enabled(self, enabled: bool) -> None:
+        """Enable or disable the stream and request a coordinator refresh.
 
-        if stream_type == "ndi":
-            # Coordinator stores NDI switch under 'ndi_switch' key
-            ndi_switch = stream_data.get("ndi_switch")
-            if ndi_switch is None:
-                return False
-            # Handle both int and string values
-            return str(ndi_switch) == "1"
+        Args:
+            enabled: True to enable the stream, False to disable it.
 
-        # For RTMP and SRT, check the publish list
-        # API uses 'switch' field for enabled state
-        publish_list = stream_data.get("publish")
-        if not isinstance(publish_list, list):
-            return False
+        Raises:
+            HomeAssistantError: If the stream state cannot be changed.
+        """
+        action = "enable" if enabled else "disable"
 
-        for entry in publish_list:
-            if not isinstance(entry, dict):
-                continue
-            if entry.get("type") == stream_type:
-                switch = entry.get("switch")
-                if switch is None:
-                    return False
-                # Handle both int and string values
-                return str(switch) == "1"
+        try:
+            await self._set_enabled(enabled)
+        except ZowietekApiError as err:
+            stream_type = self.entity_description.stream_type
+            _LOGGER.error("Failed to %s %s stream: %s", action, stream_type, err)
+            raise HomeAssistantError(f"Failed to {action} {stream_type} stream: {err}") from err
 
-        return False
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable the stream.
 
-        Calls the appropriate API method to enable the stream
-        and requests a coordinator refresh.
-
         Args:
             kwargs: Additional arguments (required by HA interface).
 
         Raises:
             HomeAssistantError: If the stream cannot be enabled.
         """
-        stream_type = self.entity_description.stream_type
-
-        try:
-            if stream_type == "ndi":
-                await self.coordinator.client.async_set_ndi_enabled(True)
-            else:
-                await self.coordinator.client.async_set_stream_enabled(stream_type, True)
-        except ZowietekApiError as err:
-            _LOGGER.error("Failed to enable %s stream: %s", stream_type, err)
-            raise HomeAssistantError(f"Failed to enable {stream_type} stream: {err}") from err
-
-        await self.coordinator.async_request_refresh()
+        await self._async_set_enabled(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable the stream.
 
-        Calls the appropriate API method to disable the stream
-        and requests a coordinator refresh.
-
         Args:
             kwargs: Additional arguments (required by HA interface).
 
         Raises:
             HomeAssistantError: If the stream cannot be disabled.
         """
-        stream_type = self.entity_description.stream_type
-
-        try:
-            if stream_type == "ndi":
-                await self.coordinator.client.async_set_ndi_enabled(False)
-            else:
-                await self.coordinator.client.async_set_stream_enabled(stream_type, False)
-        except ZowietekApiError as err:
-            _LOGGER.error("Failed to disable %s stream: %s", stream_type, err)
-            raise HomeAssistantError(f"Failed to disable {stream_type} stream: {err}") from err
-
-        await self.coordinator.async_request_refresh()
+        await self._async_set_enabled(False)
 
 
 async def async_setup_entry(
@@ -191,8 +198,6 @@ async def async_setup_entry(
     """
     coordinator = entry.runtime_data
 
-    entities: list[ZowietekSwitch] = [
+    async_add_entities(
         ZowietekSwitch(coordinator, description) for description in SWITCH_DESCRIPTIONS
-    ]
-
-    async_add_entities(entities)
+    )
@@ -10,12 +10,24 @@ import pytest
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.zowietek.const import DOMAIN
+from custom_components.zowietek.const import DOMAIN, STATUS_SUCCESS
 
 # Auto-use fixture to enable custom component loading for all tests
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 
+def _ok(**fields: Any) -> dict[str, Any]:
+    """Return a successful API response carrying the given fields.
+
+    Args:
+        fields: Response fields to include after the status envelope.
+
+    Returns:
+        A new response dict with the success status and fields.
+    """
+    return {"status": STATUS_SUCCESS, "rsp": "succeed", **fields}
+
+
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(
     enable_custom_integrations: None,
@@ -43,29 +55,25 @@ def mock_config_entry() -> MockConfigEntry:
 @pytest.fixture
 def mock_system_info() -> dict[str, Any]:
     """Return mock system info response."""
-    return {
-        "status": "00000",
-        "rsp": "succeed",
-        "devicename": "ZowieBox-Test",
-        "devicesn": "zowiebox-test-12345",
-        "softver": "1.0.0",
-        "hardver": "2.0",
-        "mac": "00:11:22:33:44:55",
-    }
+    return _ok(
+        devicename="ZowieBox-Test",
+        devicesn="zowiebox-test-12345",
+        softver="1.0.0",
+        hardver="2.0",
+        mac="00:11:22:33:44:55",
+    )
 
 
 @pytest.fixture
 def mock_video_info() -> dict[str, Any]:
     """Return mock video info response."""
-    return {
-        "status": "00000",
-        "rsp": "succeed",
-        "input_source": "hdmi",
-        "input_resolution": "1920x1080",
-        "input_fps": "60",
-        "output_resolution": "1920x1080",
-        "output_fps": "60",
-    }
+    return _ok(
+        input_source="hdmi",
+        input_resolution="1920x1080",
+        input_fps="60",
+        output_resolution="1920x1080",
+        output_fps="60",
+    )
 
 
 @pytest.fixture
@@ -75,19 +83,46 @@ def mock_stream_info() -> dict[str, Any]:
     The stream data combines publish list (RTMP/SRT) with NDI config.
     NDI uses 'switch' for enabled state, publish entries also use 'switch'.
     """
-    return {
-        "status": "00000",
-        "rsp": "succeed",
+    return _ok(
         # NDI config fields (from /video group=ndi)
-        "switch": 1,  # NDI enabled state
-        "machinename": "ZowieBox-Test",
-        "mode_id": 1,
+        switch=1,  # NDI enabled state
+        machinename="ZowieBox-Test",
+        mode_id=1,
         # Publish list (from /stream group=publish)
-        "publish": [
+        publish=[
             {"type": "rtmp", "index": 0, "switch": 0, "url": ""},
             {"type": "srt", "index": 1, "switch": 0, "url": ""},
         ],
-    }
+    )
+
+
+def _setup_basic_client(
+    client: MagicMock,
+    system_info: dict[str, Any],
+    video_info: dict[str, Any] | None = None,
+    stream_info: dict[str, Any] | None = None,
+) -> MagicMock:
+    """Add the login, info and teardown mocks shared by the client fixtures.
+
+    Args:
+        client: The mock client to setup (typically mock_client_class.return_value).
+        system_info: System info response to return.
+        video_info: Video info response to return, or None to leave it unmocked.
+        stream_info: Stream info response to return, or None to leave it unmocked.
+
+    Returns:
+        The configured mock client.
+    """
+    client.async_login = AsyncMock(return_value=True)
+    client.async_get_system_info = AsyncMock(return_value=system_info)
+    if video_info is not None:
+        client.async_get_video_info = AsyncMock(return_value=video_info)
+    if stream_info is not None:
+        client.async_get_stream_info = AsyncMock(return_value=stream_info)
+    client.async_logout = AsyncMock()
+    client.close = AsyncMock()
+    client.host = "192.168.1.100"
+    return client
 
 
 @pytest.fixture
@@ -100,15 +135,12 @@ def mock_zowietek_client(
     with patch(
         "custom_components.zowietek.config_flow.ZowietekClient", autospec=True
     ) as mock_client_class:
-        client = mock_client_class.return_value
-        client.async_login = AsyncMock(return_value=True)
-        client.async_get_system_info = AsyncMock(return_value=mock_system_info)
-        client.async_get_video_info = AsyncMock(return_value=mock_video_info)
-        client.async_get_stream_info = AsyncMock(return_value=mock_stream_info)
-        client.async_logout = AsyncMock()
-        client.close = AsyncMock()
-        client.host = "192.168.1.100"
-        yield client
+        yield _setup_basic_client(
+            mock_client_class.return_value,
+            mock_system_info,
+            mock_video_info,
+            mock_stream_info,
+        )
 
 
 def add_coordinator_mocks(client: MagicMock) -> None:
@@ -209,24 +241,20 @@ def add_coordinator_mocks(client: MagicMock) -> None:
 
     # Legacy methods (for backward compatibility with some tests)
     client.async_get_video_info = AsyncMock(
-        return_value={
-            "status": "00000",
-            "rsp": "succeed",
-            "input_source": "hdmi",
-            "input_resolution": "1920x1080",
-            "input_fps": "60",
-        }
+        return_value=_ok(
+            input_source="hdmi",
+            input_resolution="1920x1080",
+            input_fps="60",
+        )
     )
 
     # Network methods
     client.async_get_network_info = AsyncMock(
-        return_value={
-            "status": "00000",
-            "rsp": "succeed",
-            "ip": "192.168.1.100",
-            "netmask": "255.255.255.0",
-            "gateway": "192.168.1.1",
-        }
+        return_value=_ok(
+            ip="192.168.1.100",
+            netmask="255.255.255.0",
+            gateway="192.168.1.1",
+        )
     )
 
     # Write methods for number entities
@@ -307,20 +335,13 @@ def setup_mock_zowietek_client(
             # Now client has all required mocks
     """
     if system_info is None:
-        system_info = {
-            "status": "00000",
-            "rsp": "succeed",
-            "devicename": "ZowieBox-Test",
-            "devicesn": "zowiebox-test-12345",
-            "softver": "1.0.0",
-        }
+        system_info = _ok(
+            devicename="ZowieBox-Test",
+            devicesn="zowiebox-test-12345",
+            softver="1.0.0",
+        )
 
-    # Basic client methods
-    client.async_login = AsyncMock(return_value=True)
-    client.async_get_system_info = AsyncMock(return_value=system_info)
-    client.async_logout = AsyncMock()
-    client.close = AsyncMock()
-    client.host = "192.168.1.100"
+    _setup_basic_client(client, system_info)
 
     # Add all coordinator-related mocks
     add_coordinator_mocks(client)
@@ -336,14 +357,12 @@ def mock_zowietek_client_init(
 ) -> Generator[MagicMock]:
     """Mock ZowietekClient for __init__.py testing."""
     with patch("custom_components.zowietek.ZowietekClient", autospec=True) as mock_client_class:
-        client = mock_client_class.return_value
-        client.async_login = AsyncMock(return_value=True)
-        client.async_get_system_info = AsyncMock(return_value=mock_system_info)
-        client.async_get_video_info = AsyncMock(return_value=mock_video_info)
-        client.async_get_stream_info = AsyncMock(return_value=mock_stream_info)
-        client.async_logout = AsyncMock()
-        client.close = AsyncMock()
-        client.host = "192.168.1.100"
+        client = _setup_basic_client(
+            mock_client_class.return_value,
+            mock_system_info,
+            mock_video_info,
+            mock_stream_info,
+        )
         # Add coordinator-related mocks
         add_coordinator_mocks(client)
         yield client
@@ -442,6 +461,10 @@ def create_mock_coordinator(
             {"index": 0, "name": "NDI Source 1", "url": "ndi://source1"},
             {"index": 1, "name": "NDI Source 2", "url": "ndi://source2"},
         ],
+        publish_by_type={
+            "rtmp": {"type": "rtmp", "index": 0, "switch": 1, "url": "rtmp://test"},
+            "srt": {"type": "srt", "index": 1, "switch": 0, "url": ""},
+        },
     )
     coordinator.last_update_success = True
     return coordinator
@@ -2165,6 +2165,33 @@ class TestStreamplaySourceControl:
         assert body["data"]["index"] == 3
         assert body["data"]["switch"] == 0
 
+    @pytest.mark.asyncio
+    async def test_async_reload_streamplay_source_switches_off_then_on(self) -> None:
+        """Test async_reload_streamplay_source disables then re-enables the source."""
+        mock_response = _create_mock_response(
+            {
+                "status": "00000",
+                "rsp": "succeed",
+            }
+        )
+        mock_session = _create_mock_session(mock_response)
+
+        client = ZowietekClient(
+            host="192.168.1.100",
+            username="admin",
+            password="admin",
+            session=mock_session,
+        )
+
+        await client.async_reload_streamplay_source(2)
+
+        assert mock_session.post.call_count == 2
+        bodies = [call[1]["json"] for call in mock_session.post.call_args_list]
+        assert [body["data"] for body in bodies] == [
+            {"index": 2, "switch": 0},
+            {"index": 2, "switch": 1},
+        ]
+
 
 class TestNdiSourcesEdgeCases:
     """Test edge cases in NDI sources retrieval."""
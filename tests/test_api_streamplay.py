@@ -11,6 +11,7 @@ import pytest
 from custom_components.zowietek.api import ZowietekClient
 from custom_components.zowietek.const import STATUS_SUCCESS
 from custom_components.zowietek.exceptions import (
+    ZowietekApiError,
     ZowietekAuthError,
 )
 
@@ -395,6 +396,106 @@ class TestZowietekClientModifyDecodingUrl:
         assert data["name"] == "Updated Stream"
         assert data["url"] == "rtsp://newcamera.local/stream"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("active", "expected_opts"),
+        [
+            (False, ["streamplay_modify"]),
+            (True, ["streamplay_switch", "streamplay_modify"]),
+        ],
+    )
+    async def test_async_replace_decoding_url_sequence(
+        self, active: bool, expected_opts: list[str]
+    ) -> None:
+        """Test replacing a URL disables (if active) then modifies with switch=1."""
+        mock_response = _create_mock_response(
+            {
+                "status": STATUS_SUCCESS,
+                "rsp": "succeed",
+            }
+        )
+        mock_session = _create_mock_session(mock_response)
+
+        client = ZowietekClient(
+            host="192.168.1.100",
+            username="admin",
+            password="admin",
+            session=mock_session,
+        )
+
+        await client.async_replace_decoding_url(
+            index=5,
+            name="Home Assistant",
+            url="rtsp://newcamera.local/stream",
+            active=active,
+        )
+
+        bodies = [call[1]["json"] for call in mock_session.post.call_args_list]
+        assert [body["opt"] for body in bodies] == expected_opts
+        modify = bodies[-1]["data"]
+        assert modify["index"] == 5
+        assert modify["url"] == "rtsp://newcamera.local/stream"
+        assert modify["switch"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_replace_decoding_url_falls_back_to_two_steps(self) -> None:
+        """Test a rejected combined update is retried as modify then enable."""
+        mock_response = _create_mock_response({})
+        mock_response.json = AsyncMock(
+            side_effect=[
+                {"status": "00003", "rsp": "invalid params"},
+                {"status": STATUS_SUCCESS, "rsp": "succeed"},
+                {"status": STATUS_SUCCESS, "rsp": "succeed"},
+            ]
+        )
+        mock_session = _create_mock_session(mock_response)
+
+        client = ZowietekClient(
+            host="192.168.1.100",
+            username="admin",
+            password="admin",
+            session=mock_session,
+        )
+
+        await client.async_replace_decoding_url(
+            index=5,
+            name="Home Assistant",
+            url="rtsp://newcamera.local/stream",
+        )
+
+        bodies = [call[1]["json"] for call in mock_session.post.call_args_list]
+        assert [body["opt"] for body in bodies] == [
+            "streamplay_modify",
+            "streamplay_modify",
+            "streamplay_switch",
+        ]
+        assert bodies[1]["data"]["switch"] == 0
+        assert bodies[2]["data"] == {"index": 5, "switch": 1}
+
+    @pytest.mark.asyncio
+    async def test_async_replace_decoding_url_other_error_not_retried(self) -> None:
+        """Test a combined update failing with another status propagates unretried."""
+        mock_response = _create_mock_response({"status": "00001", "rsp": "failed"})
+        mock_session = _create_mock_session(mock_response)
+
+        client = ZowietekClient(
+            host="192.168.1.100",
+            username="admin",
+            password="admin",
+            session=mock_session,
+        )
+
+        with pytest.raises(ZowietekApiError) as exc_info:
+            await client.async_replace_decoding_url(
+                index=5,
+                name="Home Assistant",
+                url="rtsp://newcamera.local/stream",
+            )
+
+        assert exc_info.value.status_code == "00001"
+        bodies = [call[1]["json"] for call in mock_session.post.call_args_list]
+        assert [body["opt"] for body in bodies] == ["streamplay_modify"]
+
 
 class TestZowietekClientDeleteDecodingUrl:
     """Tests for ZowietekClient delete decoding URL endpoint."""
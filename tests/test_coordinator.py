@@ -244,6 +244,43 @@ class TestZowietekCoordinatorInit:
 
         assert coordinator.client is not None
 
+    async def test_coordinator_client_uses_shared_session(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test the API client reuses Home Assistant's shared HTTP session."""
+        from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+        from custom_components.zowietek import coordinator as coordinator_module
+
+        mock_config_entry.add_to_hass(hass)
+
+        ZowietekCoordinator(hass, mock_config_entry)
+
+        client_class = coordinator_module.ZowietekClient
+        assert client_class.call_args.kwargs["session"] is async_get_clientsession(hass)
+
+    async def test_reconcile_refresh_coalesced_and_cancelled_on_shutdown(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test reconcile requests collapse and are cancelled on shutdown."""
+        mock_config_entry.add_to_hass(hass)
+
+        coordinator = ZowietekCoordinator(hass, mock_config_entry)
+        coordinator.async_schedule_reconcile()
+        coordinator.async_schedule_reconcile()
+
+        assert coordinator._reconcile_debouncer._timer_task is not None
+
+        await coordinator.async_shutdown()
+
+        assert coordinator._reconcile_debouncer._timer_task is None
+
 
 class TestZowietekCoordinatorUpdate:
     """Tests for ZowietekCoordinator data updates."""
@@ -1684,3 +1721,96 @@ class TestCoordinatorEdgeCases:
         # Should have created empty sources list
         assert coordinator.data is not None
         assert coordinator.data.streamplay["sources"] == []
+
+    async def test_publish_entries_indexed_by_type(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test publish entries are filtered and indexed by type, first entry winning."""
+        mock_config_entry.add_to_hass(hass)
+
+        rtmp = {"type": "rtmp", "index": 0, "switch": 1}
+        mock_zowietek_client.async_get_stream_publish_info.return_value = {
+            "publish": [
+                "bogus",
+                rtmp,
+                {"type": "rtmp", "index": 2, "switch": 0},
+                {"index": 3, "switch": 1},
+            ]
+        }
+
+        coordinator = ZowietekCoordinator(hass, mock_config_entry)
+        await _refresh_coordinator(coordinator)
+
+        assert coordinator.data is not None
+        assert coordinator.data.publish_by_type == {"rtmp": rtmp}
+        assert "bogus" not in coordinator.data.stream["publish"]
+
+    async def test_source_lists_drop_non_dict_entries(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+        mock_input_signal: dict[str, str | int],
+        mock_output_info: dict[str, str | int],
+        mock_venc_info: dict[str, list[dict[str, str | int | dict[str, str | int | list[str]]]]],
+        mock_ndi_config: dict[str, str | int],
+        mock_audio_info: dict[str, str | int | dict[str, str | int | list[str]]],
+    ) -> None:
+        """Test that malformed streamplay and NDI entries are filtered out."""
+        mock_config_entry.add_to_hass(hass)
+
+        mock_zowietek_client.async_get_input_signal.return_value = mock_input_signal
+        mock_zowietek_client.async_get_output_info.return_value = mock_output_info
+        mock_zowietek_client.async_get_venc_info.return_value = mock_venc_info
+        mock_zowietek_client.async_get_stream_publish_info.return_value = {"publish": []}
+        mock_zowietek_client.async_get_ndi_config.return_value = mock_ndi_config
+        mock_zowietek_client.async_get_audio_info.return_value = mock_audio_info
+        mock_zowietek_client.async_get_streamplay_info.return_value = {
+            "streamplay": [{"index": 0, "name": "Camera"}, "bogus", None]
+        }
+        mock_zowietek_client.async_get_ndi_sources.return_value = {
+            "ndi_sources": [42, {"name": "Studio"}]
+        }
+
+        coordinator = ZowietekCoordinator(hass, mock_config_entry)
+        await _refresh_coordinator(coordinator)
+
+        assert coordinator.data is not None
+        assert coordinator.data.streamplay["sources"] == [{"index": 0, "name": "Camera"}]
+        assert coordinator.data.ndi_sources == [{"name": "Studio"}]
+
+    async def test_decoder_state_normalised_to_int(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+        mock_input_signal: dict[str, str | int],
+        mock_output_info: dict[str, str | int],
+        mock_venc_info: dict[str, list[dict[str, str | int | dict[str, str | int | list[str]]]]],
+        mock_ndi_config: dict[str, str | int],
+        mock_audio_info: dict[str, str | int | dict[str, str | int | list[str]]],
+    ) -> None:
+        """Test decoder state strings are coerced to int, falling back to 0."""
+        mock_config_entry.add_to_hass(hass)
+
+        mock_zowietek_client.async_get_input_signal.return_value = mock_input_signal
+        mock_zowietek_client.async_get_output_info.return_value = mock_output_info
+        mock_zowietek_client.async_get_venc_info.return_value = mock_venc_info
+        mock_zowietek_client.async_get_stream_publish_info.return_value = {"publish": []}
+        mock_zowietek_client.async_get_ndi_config.return_value = mock_ndi_config
+        mock_zowietek_client.async_get_audio_info.return_value = mock_audio_info
+        mock_zowietek_client.async_get_decoder_status.return_value = {"decoder_state": "1"}
+
+        coordinator = ZowietekCoordinator(hass, mock_config_entry)
+        await _refresh_coordinator(coordinator)
+
+        assert coordinator.data is not None
+        assert coordinator.data.decoder_status["state"] == 1
+
+        mock_zowietek_client.async_get_decoder_status.return_value = {"decoder_state": "bad"}
+        await _refresh_coordinator(coordinator)
+
+        assert coordinator.data.decoder_status["state"] == 0
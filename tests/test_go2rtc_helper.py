@@ -11,6 +11,8 @@ import pytest
 from homeassistant.core import HomeAssistant
 
 from custom_components.zowietek.const import (
+    GO2RTC_API_MAX_CONNECTIONS,
+    GO2RTC_API_TIMEOUT,
     GO2RTC_DEFAULT_API_URL,
     GO2RTC_DEFAULT_RTSP_PORT,
     GO2RTC_DOMAIN,
@@ -105,6 +107,70 @@ class TestGo2rtcHelperAvailability:
         helper = Go2rtcHelper(mock_hass_without_go2rtc)
         assert helper.is_available is False
 
+    async def test_availability_cached_until_stop(
+        self,
+        mock_hass_with_go2rtc: MagicMock,
+    ) -> None:
+        """Test availability and config are resolved once and reset on stop."""
+        helper = Go2rtcHelper(mock_hass_with_go2rtc)
+        assert helper.is_available is True
+
+        # Removing go2rtc does not affect the cached verdict
+        go2rtc_config = mock_hass_with_go2rtc.data.pop(GO2RTC_DOMAIN)
+        assert helper.is_available is True
+
+        await helper.async_stop()
+        assert helper.is_available is False
+
+        mock_hass_with_go2rtc.data[GO2RTC_DOMAIN] = go2rtc_config
+        await helper.async_stop()
+        assert helper.is_available is True
+
+    @pytest.mark.parametrize(
+        "go2rtc_config",
+        [
+            MagicMock(spec=[]),
+            MagicMock(spec=["url"], url=None),
+            MagicMock(spec=["url"], url=1984),
+            MagicMock(spec=["url"], url="http://[::1"),
+        ],
+        ids=["missing_attribute", "none", "not_a_string", "malformed"],
+    )
+    def test_unusable_url_falls_back_to_defaults(
+        self,
+        mock_hass_without_go2rtc: MagicMock,
+        go2rtc_config: MagicMock,
+    ) -> None:
+        """Test a loaded go2rtc without a usable URL uses the default URL."""
+        mock_hass_without_go2rtc.data[GO2RTC_DOMAIN] = go2rtc_config
+        helper = Go2rtcHelper(mock_hass_without_go2rtc)
+
+        assert helper.is_available is True
+        assert helper._get_go2rtc_config() == (
+            GO2RTC_DEFAULT_API_URL,
+            "127.0.0.1",
+            GO2RTC_DEFAULT_RTSP_PORT,
+        )
+
+    async def test_unavailable_verdict_cached_until_invalidated(
+        self,
+        mock_hass_without_go2rtc: MagicMock,
+    ) -> None:
+        """Test conversions short-circuit on a cached unavailable verdict."""
+        helper = Go2rtcHelper(mock_hass_without_go2rtc)
+        assert await helper.async_convert_camera("camera.front_door") is None
+
+        # go2rtc appearing later is ignored until the cache is invalidated
+        go2rtc_config = MagicMock()
+        go2rtc_config.url = "http://127.0.0.1:11984/"
+        mock_hass_without_go2rtc.data[GO2RTC_DOMAIN] = go2rtc_config
+        assert helper.is_available is False
+        assert await helper.async_convert_stream("http://example.com/s.m3u8") is None
+        mock_hass_without_go2rtc.states.get.assert_not_called()
+
+        helper.invalidate_availability()
+        assert helper.is_available is True
+
 
 class TestGo2rtcHelperLifecycle:
     """Tests for helper lifecycle management."""
@@ -343,6 +409,27 @@ class TestGo2rtcHelperCameraConversion:
 
         await helper.async_stop()
 
+    async def test_convert_camera_cached_skips_entity_lookup(
+        self,
+        mock_hass_with_go2rtc: MagicMock,
+        mock_aiohttp_session: MagicMock,
+    ) -> None:
+        """Test a cached camera conversion skips state lookup and API calls."""
+        mock_hass_with_go2rtc.states.get.return_value = MagicMock()
+
+        helper = Go2rtcHelper(mock_hass_with_go2rtc)
+
+        result1 = await helper.async_convert_camera("camera.front_door")
+        mock_hass_with_go2rtc.states.get.reset_mock()
+
+        result2 = await helper.async_convert_camera("camera.front_door")
+
+        assert result1 == result2
+        mock_hass_with_go2rtc.states.get.assert_not_called()
+        assert mock_aiohttp_session.put.call_count == 1
+
+        await helper.async_stop()
+
 
 class TestGo2rtcHelperStreamCleanup:
     """Tests for TTL-based stream cleanup."""
@@ -379,6 +466,30 @@ class TestGo2rtcHelperStreamCleanup:
 
         await helper.async_stop()
 
+    async def test_cleanup_tolerates_stream_removed_during_delete(
+        self,
+        mock_hass_with_go2rtc: MagicMock,
+        mock_aiohttp_session: MagicMock,
+    ) -> None:
+        """Test cleanup does not fail if a stream disappears mid-delete."""
+        helper = Go2rtcHelper(mock_hass_with_go2rtc)
+
+        await helper.async_convert_stream("http://example.com/stream.m3u8")
+        stream_name = next(iter(helper._streams.keys()))
+        helper._streams[stream_name].last_accessed = datetime.now() - timedelta(
+            seconds=GO2RTC_STREAM_TTL + 60
+        )
+
+        async def _delete_and_remove(name: str) -> None:
+            helper._streams.pop(name, None)
+
+        with patch.object(helper, "_delete_stream", side_effect=_delete_and_remove):
+            await helper._cleanup_inactive_streams()
+
+        assert len(helper._streams) == 0
+
+        await helper.async_stop()
+
     async def test_cleanup_keeps_active_streams(
         self,
         mock_hass_with_go2rtc: MagicMock,
@@ -451,6 +562,39 @@ class TestGo2rtcHelperApiCalls:
 
         await helper.async_stop()
 
+    async def test_session_uses_shared_timeout(
+        self,
+        mock_hass_with_go2rtc: MagicMock,
+    ) -> None:
+        """Test the session carries the timeout and a bounded keep-alive pool."""
+        with (
+            patch(
+                "custom_components.zowietek.go2rtc_helper.aiohttp.ClientSession"
+            ) as mock_session_class,
+            patch(
+                "custom_components.zowietek.go2rtc_helper.get_url",
+                return_value="http://127.0.0.1:8123",
+            ),
+        ):
+            mock_response = MagicMock()
+            mock_response.status = 200
+            mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_response.__aexit__ = AsyncMock(return_value=None)
+            mock_session = mock_session_class.return_value
+            mock_session.put = MagicMock(return_value=mock_response)
+            mock_session.delete = MagicMock(return_value=mock_response)
+            mock_session.close = AsyncMock()
+
+            helper = Go2rtcHelper(mock_hass_with_go2rtc)
+            await helper.async_convert_stream("http://example.com/stream.m3u8")
+
+            session_kwargs = mock_session_class.call_args.kwargs
+            assert session_kwargs["timeout"].total == GO2RTC_API_TIMEOUT
+            assert session_kwargs["connector"].limit_per_host == GO2RTC_API_MAX_CONNECTIONS
+            assert "timeout" not in mock_session.put.call_args.kwargs
+
+            await helper.async_stop()
+
     async def test_delete_stream_calls_correct_endpoint(
         self,
         mock_hass_with_go2rtc: MagicMock,
@@ -17,6 +17,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import async_get_platforms
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.zowietek.const import DOMAIN
@@ -255,8 +256,10 @@ def mock_zowietek_client(
         # Control methods
         client.async_add_decoding_url = AsyncMock()
         client.async_modify_decoding_url = AsyncMock()
+        client.async_replace_decoding_url = AsyncMock()
         client.async_delete_decoding_url = AsyncMock()
         client.async_select_streamplay_source = AsyncMock()
+        client.async_reload_streamplay_source = AsyncMock()
         client.async_stop_streamplay = AsyncMock()
         client.async_enable_ndi_decoding = AsyncMock()
         client.async_disable_ndi_decoding = AsyncMock()
@@ -563,6 +566,206 @@ class TestMediaPlayerSourceList:
         assert source_list == []
 
 
+class TestMediaPlayerSourceCache:
+    """Tests for cached source lookups."""
+
+    async def test_source_lookups_cached_between_updates(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test source lookups are built once and reused until the next update."""
+        from custom_components.zowietek.media_player import ZowietekMediaPlayer
+
+        await _setup_integration(hass, mock_config_entry)
+
+        coordinator = mock_config_entry.runtime_data
+        media_player = ZowietekMediaPlayer(coordinator)
+
+        source_list = media_player.source_list
+        coordinator.data.streamplay["sources"] = []
+
+        assert media_player.source_list is source_list
+        assert media_player._find_source_index("Test Stream 2") == 1
+
+    async def test_source_lookups_rebuilt_on_coordinator_update(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test a coordinator update invalidates the cached source lookups."""
+        import dataclasses
+
+        await _setup_integration(hass, mock_config_entry)
+
+        coordinator = mock_config_entry.runtime_data
+        coordinator.async_set_updated_data(
+            dataclasses.replace(
+                coordinator.data,
+                streamplay={
+                    "sources": [{"index": 3, "name": "New Source", "url": "rtsp://new/live"}]
+                },
+            )
+        )
+        await hass.async_block_till_done()
+
+        state = hass.states.get("media_player.zowiebox_studio_decoder")
+        assert state is not None
+        assert state.attributes["source_list"] == [
+            "New Source",
+            "NDI: NDI Source 1",
+            "NDI: NDI Source 2",
+        ]
+
+    async def test_source_index_rebuilt_only_when_sources_replaced(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test updates that keep the same source objects reuse the index."""
+        import dataclasses
+
+        from custom_components.zowietek.media_player import ZowietekMediaPlayer
+
+        await _setup_integration(hass, mock_config_entry)
+
+        coordinator = mock_config_entry.runtime_data
+        media_player = ZowietekMediaPlayer(coordinator)
+        index = media_player._streamplay_index
+
+        coordinator.data.decoder_status["state"] = 0
+        media_player._update_from_coordinator()
+        assert media_player._streamplay_index is index
+
+        coordinator.data = dataclasses.replace(coordinator.data, ndi_sources=[])
+        media_player._update_from_coordinator()
+        assert media_player._streamplay_index is not index
+        assert media_player.source_list == ["Test Stream 1", "Test Stream 2"]
+
+    async def test_extra_attributes_reused_when_decoder_values_unchanged(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test the attributes dict is only rebuilt when its inputs change."""
+        from custom_components.zowietek.media_player import ZowietekMediaPlayer
+
+        await _setup_integration(hass, mock_config_entry)
+
+        coordinator = mock_config_entry.runtime_data
+        media_player = ZowietekMediaPlayer(coordinator)
+        attrs = media_player.extra_state_attributes
+
+        coordinator.data.decoder_status["state"] = 0
+        media_player._update_from_coordinator()
+        assert media_player.extra_state_attributes is attrs
+
+        coordinator.data.decoder_status["framerate"] = 25
+        media_player._update_from_coordinator()
+        assert media_player.extra_state_attributes is not attrs
+        assert media_player.extra_state_attributes["framerate"] == 25
+
+    async def test_state_attributes_cached_until_coordinator_update(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test state, source and attributes are recomputed only on updates."""
+        from custom_components.zowietek.media_player import ZowietekMediaPlayer
+
+        await _setup_integration(hass, mock_config_entry)
+
+        coordinator = mock_config_entry.runtime_data
+        entity_id = "media_player.zowiebox_studio_decoder"
+        media_player = ZowietekMediaPlayer(coordinator)
+
+        coordinator.data.decoder_status["state"] = 0
+        coordinator.data.decoder_status["bandwidth"] = 1234
+
+        # Not a listener, so the cached attributes are untouched
+        assert media_player.state == MediaPlayerState.PLAYING
+        assert media_player.source == "Test Stream 1"
+
+        coordinator.async_update_listeners()
+        await hass.async_block_till_done()
+
+        state = hass.states.get(entity_id)
+        assert state is not None
+        assert state.state == MediaPlayerState.IDLE
+        assert "source" not in state.attributes
+        assert state.attributes["bandwidth_kbps"] == 1234
+
+    async def test_streamplay_index_first_entry_wins(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test the index keeps device order and the first duplicate name/URL."""
+        import dataclasses
+
+        from custom_components.zowietek.media_player import StreamplayIndex
+
+        await _setup_integration(hass, mock_config_entry)
+
+        coordinator = mock_config_entry.runtime_data
+        data = dataclasses.replace(
+            coordinator.data,
+            streamplay={
+                "sources": [
+                    {"index": 4, "name": "Dup", "url": "rtsp://a/live"},
+                    {"index": 2, "name": "Dup", "url": "rtsp://a/live"},
+                ]
+            },
+            ndi_sources=[],
+        )
+
+        index = StreamplayIndex.from_data(data)
+
+        assert [source.index for source in index.ordered] == [4, 2]
+        assert index.by_name["Dup"].index == 4
+        assert index.by_url["rtsp://a/live"].index == 4
+        assert index.source_list == ["Dup", "Dup"]
+        assert StreamplayIndex.from_data(None).source_list == []
+
+    async def test_streamplay_index_skips_unusable_entries(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test an entry without a name or index is left out of the index."""
+        import dataclasses
+
+        from custom_components.zowietek.media_player import StreamplayIndex
+
+        await _setup_integration(hass, mock_config_entry)
+
+        coordinator = mock_config_entry.runtime_data
+        data = dataclasses.replace(
+            coordinator.data,
+            streamplay={
+                "sources": [
+                    {"url": "rtsp://orphan/live", "switch": 1},
+                    {"index": 3, "name": "Kept", "url": "rtsp://kept/live"},
+                ]
+            },
+            ndi_sources=[],
+        )
+
+        index = StreamplayIndex.from_data(data)
+
+        assert [source.index for source in index.ordered] == [3]
+        assert index.source_list == ["Kept"]
+        assert list(index.by_name) == ["Kept"]
+        assert list(index.by_url) == ["rtsp://kept/live"]
+
+
 class TestMediaPlayerSource:
     """Tests for media player current source."""
 
@@ -641,24 +844,60 @@ class TestMediaPlayerSelectSource:
 
         mock_zowietek_client.async_enable_ndi_decoding.assert_called_once_with("NDI Source 1")
 
-    async def test_select_source_requests_refresh(
+    async def test_select_source_updates_state_optimistically(
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
         mock_zowietek_client: MagicMock,
     ) -> None:
-        """Test selecting source requests coordinator refresh."""
+        """Test selecting source updates state without a full refresh."""
         from custom_components.zowietek.media_player import ZowietekMediaPlayer
 
         await _setup_integration(hass, mock_config_entry)
 
         coordinator = mock_config_entry.runtime_data
         coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_schedule_reconcile = MagicMock()
         media_player = ZowietekMediaPlayer(coordinator)
 
         await media_player.async_select_source("Test Stream 1")
 
-        coordinator.async_request_refresh.assert_called_once()
+        assert coordinator.data.decoder_status["state"] == 1
+        assert coordinator.data.decoder_status["active_source"] == "Test Stream 1"
+        coordinator.async_request_refresh.assert_not_called()
+        coordinator.async_schedule_reconcile.assert_called_once()
+
+
+class TestMediaPlayerOptimisticState:
+    """Tests for optimistic state updates on the registered entity."""
+
+    async def test_stop_updates_entity_state_immediately(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test a stop command is reflected in entity state before any refresh."""
+        await _setup_integration(hass, mock_config_entry)
+
+        entity_id = "media_player.zowiebox_studio_decoder"
+        assert hass.states.get(entity_id).state == MediaPlayerState.PLAYING
+
+        mock_zowietek_client.async_get_decoder_status.reset_mock()
+        await hass.services.async_call(
+            "media_player",
+            "media_stop",
+            {"entity_id": entity_id},
+            blocking=True,
+        )
+
+        state = hass.states.get(entity_id)
+        assert state is not None
+        assert state.state == MediaPlayerState.IDLE
+        assert "source" not in state.attributes
+        mock_zowietek_client.async_get_decoder_status.assert_not_called()
+
+        await hass.config_entries.async_unload(mock_config_entry.entry_id)
 
 
 class TestMediaPlayerStop:
@@ -682,24 +921,28 @@ class TestMediaPlayerStop:
 
         mock_zowietek_client.async_stop_streamplay.assert_called_once()
 
-    async def test_stop_requests_refresh(
+    async def test_stop_updates_state_optimistically(
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
         mock_zowietek_client: MagicMock,
     ) -> None:
-        """Test stop requests coordinator refresh."""
+        """Test stop updates state without a full refresh."""
         from custom_components.zowietek.media_player import ZowietekMediaPlayer
 
         await _setup_integration(hass, mock_config_entry)
 
         coordinator = mock_config_entry.runtime_data
         coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_schedule_reconcile = MagicMock()
         media_player = ZowietekMediaPlayer(coordinator)
 
         await media_player.async_media_stop()
 
-        coordinator.async_request_refresh.assert_called_once()
+        assert coordinator.data.decoder_status["state"] == 0
+        assert coordinator.data.decoder_status["active_source"] == ""
+        coordinator.async_request_refresh.assert_not_called()
+        coordinator.async_schedule_reconcile.assert_called_once()
 
 
 class TestMediaPlayerPlay:
@@ -727,6 +970,26 @@ class TestMediaPlayerPlay:
         # Should select the first enabled source (index 0)
         mock_zowietek_client.async_select_streamplay_source.assert_called_once_with(0)
 
+    async def test_play_prefers_enabled_source(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test play resumes the enabled source rather than the first one."""
+        from custom_components.zowietek.media_player import ZowietekMediaPlayer
+
+        await _setup_integration(hass, mock_config_entry)
+
+        coordinator = mock_config_entry.runtime_data
+        for entry in coordinator.data.streamplay["sources"]:
+            entry["switch"] = 1 if entry["index"] == 1 else 0
+        media_player = ZowietekMediaPlayer(coordinator)
+
+        await media_player.async_media_play()
+
+        mock_zowietek_client.async_select_streamplay_source.assert_called_once_with(1)
+
 
 class TestMediaPlayerPlayMedia:
     """Tests for media player play_media action."""
@@ -780,37 +1043,75 @@ class TestMediaPlayerPlayMedia:
         # Source name should be HA_SOURCE_NAME, not the custom title
         assert call_args[1]["name"] == HA_SOURCE_NAME
 
-    async def test_play_media_requests_refresh(
+    async def test_play_media_new_source_refreshes_instead_of_optimistic(
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
         mock_zowietek_client: MagicMock,
     ) -> None:
-        """Test play_media requests coordinator refresh."""
+        """Test play_media of a new URL fetches real state without an optimistic update."""
         from custom_components.zowietek.media_player import ZowietekMediaPlayer
 
         await _setup_integration(hass, mock_config_entry)
 
         coordinator = mock_config_entry.runtime_data
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_refresh = AsyncMock()
+        coordinator.async_schedule_reconcile = MagicMock()
+        decoder_status = dict(coordinator.data.decoder_status)
         media_player = ZowietekMediaPlayer(coordinator)
 
         await media_player.async_play_media(media_type="url", media_id="rtsp://new.stream/live")
 
-        coordinator.async_request_refresh.assert_called_once()
+        assert coordinator.data.decoder_status == decoder_status
+        coordinator.async_refresh.assert_awaited_once()
+        coordinator.async_schedule_reconcile.assert_not_called()
 
-    async def test_play_media_modifies_existing_ha_source(
+    async def test_play_media_twice_repoints_added_ha_source(
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
         mock_zowietek_client: MagicMock,
+        mock_streamplay_info: dict[str, list[dict[str, str | int]]],
     ) -> None:
-        """Test play_media modifies existing HA source instead of adding a new one.
+        """Test a second play_media right after adding the HA source reuses it."""
+        from custom_components.zowietek.media_player import (
+            HA_SOURCE_NAME,
+            ZowietekMediaPlayer,
+        )
+
+        await _setup_integration(hass, mock_config_entry)
+
+        async def _add_source(**kwargs: object) -> None:
+            mock_streamplay_info["streamplay"].append(
+                {"index": 5, "name": HA_SOURCE_NAME, "url": str(kwargs["url"]), "switch": 1}
+            )
 
-        The ZowieBox streamplay lifecycle requires:
-        1. Update URL with switch=False
-        2. Then explicitly enable with async_select_streamplay_source
-        """
+        mock_zowietek_client.async_add_decoding_url.side_effect = _add_source
+        # Use the registered entity so it receives coordinator updates
+        media_player = next(
+            platform.entities["media_player.zowiebox_studio_decoder"]
+            for platform in async_get_platforms(hass, DOMAIN)
+            if platform.domain == "media_player"
+        )
+        assert isinstance(media_player, ZowietekMediaPlayer)
+
+        await media_player.async_play_media(media_type="url", media_id="rtsp://first.stream/live")
+        await media_player.async_play_media(media_type="url", media_id="rtsp://second.stream/live")
+
+        mock_zowietek_client.async_add_decoding_url.assert_called_once()
+        mock_zowietek_client.async_replace_decoding_url.assert_called_once()
+        call_args = mock_zowietek_client.async_replace_decoding_url.call_args
+        assert call_args[1]["index"] == 5
+        assert call_args[1]["url"] == "rtsp://second.stream/live"
+        assert call_args[1]["active"] is True
+
+    async def test_play_media_modifies_existing_ha_source(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test play_media modifies existing HA source instead of adding a new one."""
         from custom_components.zowietek.media_player import (
             HA_SOURCE_NAME,
             ZowietekMediaPlayer,
@@ -835,16 +1136,14 @@ class TestMediaPlayerPlayMedia:
             media_id="rtsp://new.stream/live",
         )
 
-        # Should modify existing source with switch=False, then enable it
+        # Should replace the existing source's URL in a single client call
         mock_zowietek_client.async_add_decoding_url.assert_not_called()
-        mock_zowietek_client.async_modify_decoding_url.assert_called_once()
-        call_args = mock_zowietek_client.async_modify_decoding_url.call_args
+        mock_zowietek_client.async_replace_decoding_url.assert_called_once()
+        call_args = mock_zowietek_client.async_replace_decoding_url.call_args
         assert call_args[1]["index"] == 5
         assert call_args[1]["name"] == HA_SOURCE_NAME
         assert call_args[1]["url"] == "rtsp://new.stream/live"
-        assert call_args[1]["switch"] is False  # Updated OFF, then enabled separately
-        # Should then enable the source
-        mock_zowietek_client.async_select_streamplay_source.assert_called_once_with(5)
+        assert call_args[1]["active"] is False
 
     async def test_play_media_switches_to_existing_url(
         self,
@@ -910,11 +1209,12 @@ class TestMediaPlayerPlayMedia:
             media_id="rtsp://active.camera/stream",
         )
 
-        # Should cycle OFF then ON to force reload
+        # Should reload the source in a single client call
         mock_zowietek_client.async_add_decoding_url.assert_not_called()
         mock_zowietek_client.async_modify_decoding_url.assert_not_called()
-        mock_zowietek_client.async_disable_streamplay_source.assert_called_once_with(7)
-        mock_zowietek_client.async_select_streamplay_source.assert_called_once_with(7)
+        mock_zowietek_client.async_reload_streamplay_source.assert_called_once_with(7)
+        mock_zowietek_client.async_disable_streamplay_source.assert_not_called()
+        mock_zowietek_client.async_select_streamplay_source.assert_not_called()
 
     async def test_play_media_ha_source_active_cycles_before_update(
         self,
@@ -947,11 +1247,10 @@ class TestMediaPlayerPlayMedia:
             media_id="rtsp://new.stream/live",
         )
 
-        # Should turn OFF the active HA source first, then update, then turn ON
+        # Should tell the client the HA source is active so it is cycled
         mock_zowietek_client.async_add_decoding_url.assert_not_called()
-        mock_zowietek_client.async_disable_streamplay_source.assert_called_once_with(5)
-        mock_zowietek_client.async_modify_decoding_url.assert_called_once()
-        mock_zowietek_client.async_select_streamplay_source.assert_called_once_with(5)
+        mock_zowietek_client.async_replace_decoding_url.assert_called_once()
+        assert mock_zowietek_client.async_replace_decoding_url.call_args[1]["active"] is True
 
 
 class TestMediaPlayerExtraAttributes:
@@ -1049,6 +1348,47 @@ class TestMediaPlayerAvailability:
 
         assert media_player.available is False
 
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("async_select_source", ("Test Stream 1",)),
+            ("async_media_stop", ()),
+            ("async_media_play", ()),
+            ("async_play_media", ("url", "rtsp://new.stream/live")),
+            ("async_turn_off", ()),
+            ("async_turn_on", ()),
+        ],
+    )
+    async def test_commands_rejected_when_unavailable(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+        method: str,
+        args: tuple[str, ...],
+    ) -> None:
+        """Test commands raise without touching the device when it is unavailable."""
+        from homeassistant.exceptions import HomeAssistantError
+
+        from custom_components.zowietek.media_player import ZowietekMediaPlayer
+
+        await _setup_integration(hass, mock_config_entry)
+
+        coordinator = mock_config_entry.runtime_data
+        coordinator.last_update_success = False
+        coordinator.async_schedule_reconcile = MagicMock()
+        media_player = ZowietekMediaPlayer(coordinator)
+
+        with pytest.raises(HomeAssistantError, match="Device unavailable"):
+            await getattr(media_player, method)(*args)
+
+        mock_zowietek_client.async_select_streamplay_source.assert_not_called()
+        mock_zowietek_client.async_stop_streamplay.assert_not_called()
+        mock_zowietek_client.async_add_decoding_url.assert_not_called()
+        mock_zowietek_client.async_power_off.assert_not_called()
+        mock_zowietek_client.async_power_on.assert_not_called()
+        coordinator.async_schedule_reconcile.assert_not_called()
+
 
 class TestMediaPlayerErrorHandling:
     """Tests for error handling in media player."""
@@ -1177,24 +1517,27 @@ class TestMediaPlayerTurnOff:
 
         mock_zowietek_client.async_power_off.assert_called_once()
 
-    async def test_turn_off_requests_refresh(
+    async def test_turn_off_updates_state_optimistically(
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
         mock_zowietek_client: MagicMock,
     ) -> None:
-        """Test turn_off requests coordinator refresh."""
+        """Test turn_off updates state without a full refresh."""
         from custom_components.zowietek.media_player import ZowietekMediaPlayer
 
         await _setup_integration(hass, mock_config_entry)
 
         coordinator = mock_config_entry.runtime_data
         coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_schedule_reconcile = MagicMock()
         media_player = ZowietekMediaPlayer(coordinator)
 
         await media_player.async_turn_off()
 
-        coordinator.async_request_refresh.assert_called_once()
+        assert coordinator.data.run_status["status"] == 0
+        coordinator.async_request_refresh.assert_not_called()
+        coordinator.async_schedule_reconcile.assert_called_once()
 
     async def test_turn_off_api_error_raises_ha_error(
         self,
@@ -1684,24 +2027,27 @@ class TestMediaPlayerTurnOn:
 
         mock_zowietek_client.async_power_on.assert_called_once()
 
-    async def test_turn_on_requests_refresh(
+    async def test_turn_on_updates_state_optimistically(
         self,
         hass: HomeAssistant,
         mock_config_entry: MockConfigEntry,
         mock_zowietek_client: MagicMock,
     ) -> None:
-        """Test turn_on requests coordinator refresh."""
+        """Test turn_on updates state without a full refresh."""
         from custom_components.zowietek.media_player import ZowietekMediaPlayer
 
         await _setup_integration(hass, mock_config_entry)
 
         coordinator = mock_config_entry.runtime_data
         coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_schedule_reconcile = MagicMock()
         media_player = ZowietekMediaPlayer(coordinator)
 
         await media_player.async_turn_on()
 
-        coordinator.async_request_refresh.assert_called_once()
+        assert coordinator.data.run_status["status"] == 1
+        coordinator.async_request_refresh.assert_not_called()
+        coordinator.async_schedule_reconcile.assert_called_once()
 
     async def test_turn_on_api_error_raises_ha_error(
         self,
@@ -1842,122 +2188,82 @@ class TestMediaPlayerGo2rtcConversion:
 
         assert media_player._get_go2rtc_helper() is None
 
-    async def test_needs_go2rtc_conversion_returns_false_for_rtsp(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_zowietek_client: MagicMock,
-    ) -> None:
+    def test_classify_url_needs_go2rtc_false_for_rtsp(self) -> None:
         """Test RTSP URLs do not need conversion."""
-        from custom_components.zowietek.media_player import ZowietekMediaPlayer
+        from custom_components.zowietek.media_player import _classify_url
 
-        await _setup_integration(hass, mock_config_entry)
+        assert _classify_url("rtsp://test.stream/live")[0] is False
+        assert _classify_url("RTSP://TEST.STREAM/LIVE")[0] is False
 
-        coordinator = mock_config_entry.runtime_data
-        media_player = ZowietekMediaPlayer(coordinator)
-
-        assert media_player._needs_go2rtc_conversion("rtsp://test.stream/live") is False
-        assert media_player._needs_go2rtc_conversion("RTSP://TEST.STREAM/LIVE") is False
-
-    async def test_needs_go2rtc_conversion_returns_false_for_rtmp(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_zowietek_client: MagicMock,
-    ) -> None:
+    def test_classify_url_needs_go2rtc_false_for_rtmp(self) -> None:
         """Test RTMP URLs do not need conversion."""
-        from custom_components.zowietek.media_player import ZowietekMediaPlayer
+        from custom_components.zowietek.media_player import _classify_url
 
-        await _setup_integration(hass, mock_config_entry)
+        assert _classify_url("rtmp://live.example.com/stream")[0] is False
 
-        coordinator = mock_config_entry.runtime_data
-        media_player = ZowietekMediaPlayer(coordinator)
-
-        assert media_player._needs_go2rtc_conversion("rtmp://live.example.com/stream") is False
-
-    async def test_needs_go2rtc_conversion_returns_false_for_srt(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_zowietek_client: MagicMock,
-    ) -> None:
+    def test_classify_url_needs_go2rtc_false_for_srt(self) -> None:
         """Test SRT URLs do not need conversion."""
-        from custom_components.zowietek.media_player import ZowietekMediaPlayer
-
-        await _setup_integration(hass, mock_config_entry)
+        from custom_components.zowietek.media_player import _classify_url
 
-        coordinator = mock_config_entry.runtime_data
-        media_player = ZowietekMediaPlayer(coordinator)
+        assert _classify_url("srt://192.168.1.1:9000")[0] is False
 
-        assert media_player._needs_go2rtc_conversion("srt://192.168.1.1:9000") is False
-
-    async def test_needs_go2rtc_conversion_returns_true_for_hls(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_zowietek_client: MagicMock,
-    ) -> None:
+    def test_classify_url_needs_go2rtc_true_for_hls(self) -> None:
         """Test HLS URLs need conversion."""
-        from custom_components.zowietek.media_player import ZowietekMediaPlayer
-
-        await _setup_integration(hass, mock_config_entry)
+        from custom_components.zowietek.media_player import _classify_url
 
-        coordinator = mock_config_entry.runtime_data
-        media_player = ZowietekMediaPlayer(coordinator)
+        assert _classify_url("http://example.com/stream.m3u8")[0] is True
+        assert _classify_url("https://example.com/stream.M3U8")[0] is True
 
-        assert media_player._needs_go2rtc_conversion("http://example.com/stream.m3u8") is True
-        assert media_player._needs_go2rtc_conversion("https://example.com/stream.M3U8") is True
-
-    async def test_needs_go2rtc_conversion_returns_true_for_dash(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_zowietek_client: MagicMock,
-    ) -> None:
+    def test_classify_url_needs_go2rtc_true_for_dash(self) -> None:
         """Test DASH URLs need conversion."""
-        from custom_components.zowietek.media_player import ZowietekMediaPlayer
+        from custom_components.zowietek.media_player import _classify_url
 
-        await _setup_integration(hass, mock_config_entry)
+        assert _classify_url("http://example.com/manifest.mpd")[0] is True
 
-        coordinator = mock_config_entry.runtime_data
-        media_player = ZowietekMediaPlayer(coordinator)
+    def test_classify_url_needs_go2rtc_true_for_camera_entity(self) -> None:
+        """Test camera entity IDs need conversion."""
+        from custom_components.zowietek.media_player import _classify_url
 
-        assert media_player._needs_go2rtc_conversion("http://example.com/manifest.mpd") is True
+        assert _classify_url("camera.front_door")[0] is True
 
-    async def test_needs_go2rtc_conversion_returns_true_for_camera_entity(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_zowietek_client: MagicMock,
-    ) -> None:
-        """Test camera entity IDs need conversion."""
-        from custom_components.zowietek.media_player import ZowietekMediaPlayer
+    def test_classify_url_needs_go2rtc_true_for_plain_http(self) -> None:
+        """Test plain HTTP URLs need conversion (ZowieBox doesn't support HTTP)."""
+        from custom_components.zowietek.media_player import _classify_url
 
-        await _setup_integration(hass, mock_config_entry)
+        # All HTTP/HTTPS URLs need conversion since ZowieBox only supports RTSP/RTMP/SRT
+        assert _classify_url("http://example.com/stream")[0] is True
+        assert _classify_url("https://example.com/video.mp4")[0] is True
+        assert _classify_url("http://tv.example.com/ts/stream/123")[0] is True
 
-        coordinator = mock_config_entry.runtime_data
-        media_player = ZowietekMediaPlayer(coordinator)
+    def test_classify_url_returns_conversion_and_stream_type(self) -> None:
+        """Test URL classification yields both the go2rtc flag and stream type."""
+        from custom_components.zowietek.media_player import _classify_url
 
-        assert media_player._needs_go2rtc_conversion("camera.front_door") is True
+        assert _classify_url("rtsp://test.stream/live") == (False, 1)
+        assert _classify_url("RTMP://live.example.com/stream") == (False, 2)
+        assert _classify_url("srt://192.168.1.1:9000") == (False, 3)
+        assert _classify_url("https://example.com/stream.m3u8") == (True, 1)
+        assert _classify_url("camera.front_door") == (True, 1)
+        assert _classify_url("not-a-url") == (True, 1)
+        assert _classify_url("rtsps://example.com/live") == (True, 1)
 
-    async def test_needs_go2rtc_conversion_returns_true_for_plain_http(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_zowietek_client: MagicMock,
-    ) -> None:
-        """Test plain HTTP URLs need conversion (ZowieBox doesn't support HTTP)."""
-        from custom_components.zowietek.media_player import ZowietekMediaPlayer
+    def test_classify_media_routes_cameras_and_urls(self) -> None:
+        """Test play_media classification for camera types and URLs."""
+        from custom_components.zowietek.media_player import _classify_media
 
-        await _setup_integration(hass, mock_config_entry)
+        camera = _classify_media("camera", "camera.front_door")
+        assert camera.is_camera is True
+        assert camera.needs_go2rtc is True
 
-        coordinator = mock_config_entry.runtime_data
-        media_player = ZowietekMediaPlayer(coordinator)
+        implicit_camera = _classify_media("url", "camera.front_door")
+        assert implicit_camera.is_camera is True
 
-        # All HTTP/HTTPS URLs need conversion since ZowieBox only supports RTSP/RTMP/SRT
-        assert media_player._needs_go2rtc_conversion("http://example.com/stream") is True
-        assert media_player._needs_go2rtc_conversion("https://example.com/video.mp4") is True
-        assert media_player._needs_go2rtc_conversion("http://tv.example.com/ts/stream/123") is True
+        rtmp = _classify_media("url", "rtmp://live.example.com/stream")
+        assert rtmp == (False, False, 2)
+
+        hls = _classify_media("url", "https://example.com/stream.m3u8")
+        assert hls.is_camera is False
+        assert hls.needs_go2rtc is True
 
     async def test_play_media_with_camera_entity_type(
         self,
@@ -2268,23 +2574,13 @@ class TestMediaPlayerGo2rtcConversion:
         assert "go2rtc is required" in str(exc_info.value)
         assert "http://example.com/stream.ts" in str(exc_info.value)
 
-    async def test_needs_go2rtc_conversion_returns_true_for_unknown_protocol(
-        self,
-        hass: HomeAssistant,
-        mock_config_entry: MockConfigEntry,
-        mock_zowietek_client: MagicMock,
-    ) -> None:
+    def test_classify_url_needs_go2rtc_true_for_unknown_protocol(self) -> None:
         """Test unknown protocols return True (try conversion if go2rtc available)."""
-        from custom_components.zowietek.media_player import ZowietekMediaPlayer
-
-        await _setup_integration(hass, mock_config_entry)
-
-        coordinator = mock_config_entry.runtime_data
-        media_player = ZowietekMediaPlayer(coordinator)
+        from custom_components.zowietek.media_player import _classify_url
 
         # Unknown protocol should return True
-        assert media_player._needs_go2rtc_conversion("webrtc://example.com/stream") is True
-        assert media_player._needs_go2rtc_conversion("custom://some/url") is True
+        assert _classify_url("webrtc://example.com/stream")[0] is True
+        assert _classify_url("custom://some/url")[0] is True
 
     async def test_play_media_camera_conversion_failure_raises_error(
         self,
@@ -391,6 +391,8 @@ class TestZowietekData:
         assert data.decoder_status["state"] == 0
         assert data.ndi_sources == []
         assert data.run_status["status"] == 1
+        # Slotted dataclass: no per-instance __dict__
+        assert not hasattr(data, "__dict__")
 
     def test_zowietek_data_fields_have_correct_types(self) -> None:
         """Test that ZowietekData fields have the correct type annotations.
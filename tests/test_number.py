@@ -487,6 +487,31 @@ class TestStreamBitrateNumber:
         # API should receive bitrate in bps (20 Mbps = 20000000 bps)
         mock_zowietek_client.async_set_encoder_bitrate.assert_called_once_with(20000000)
 
+    async def test_stream_bitrate_set_fractional_value_rounds(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test fractional Mbps values are rounded, not truncated, to bps."""
+        from custom_components.zowietek.number import (
+            NUMBER_DESCRIPTIONS,
+            ZowietekNumber,
+        )
+
+        await _setup_integration(hass, mock_config_entry)
+
+        coordinator = mock_config_entry.runtime_data
+        coordinator.async_request_refresh = AsyncMock()
+        descriptions = {desc.key: desc for desc in NUMBER_DESCRIPTIONS}
+
+        number = ZowietekNumber(coordinator, descriptions["stream_bitrate"])
+
+        # 4.1 * 1_000_000 is 4099999.9999999995 in floating point
+        await number.async_set_native_value(4.1)
+
+        mock_zowietek_client.async_set_encoder_bitrate.assert_called_once_with(4100000)
+
     async def test_stream_bitrate_set_value_requests_refresh(
         self,
         hass: HomeAssistant,
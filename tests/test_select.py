@@ -403,6 +403,10 @@ class TestEncoderTypeSelect:
         # Mock venc_info has codec_list: ["H.264", "H.265", "MJPEG"]
         assert select.options == ["H.264", "H.265", "MJPEG"]
 
+        # Options are a copy; mutating them must not touch coordinator data
+        select.options.append("AV1")
+        assert coordinator.data.video["codec_list"] == ["H.264", "H.265", "MJPEG"]
+
     async def test_encoder_type_select_option_calls_api(
         self,
         hass: HomeAssistant,
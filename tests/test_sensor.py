@@ -15,6 +15,7 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.zowietek.const import DOMAIN
 from custom_components.zowietek.sensor import (
     SENSOR_DESCRIPTIONS,
+    VALUE_KEY_SECTIONS,
     ZowietekSensor,
     ZowietekSensorEntityDescription,
 )
@@ -223,6 +224,23 @@ class TestSensorDescriptions:
         assert SENSOR_DESCRIPTIONS is not None
         assert len(SENSOR_DESCRIPTIONS) == 12
 
+    def test_sensor_value_keys_use_known_sections(self) -> None:
+        """Test every description addresses a section the sensor can read."""
+        for desc in SENSOR_DESCRIPTIONS:
+            section, _, key = desc.value_key.partition(".")
+            assert section in VALUE_KEY_SECTIONS, desc.key
+            assert key, desc.key
+
+    def test_value_key_resolution_shared_between_entries(self) -> None:
+        """Test parsed value_key accessors are reused rather than rebuilt."""
+        from custom_components.zowietek.sensor import _resolve_value_key
+
+        first = _resolve_value_key("video.enc_type")
+        assert first[0] is not None
+        assert first[1] == "enc_type"
+        assert _resolve_value_key("video.enc_type") is first
+        assert _resolve_value_key("ndi_sources.name") == (None, "name")
+
     def test_video_resolution_description(self) -> None:
         """Test video resolution sensor description."""
         descriptions = {desc.key: desc for desc in SENSOR_DESCRIPTIONS}
@@ -687,6 +705,28 @@ class TestSensorEdgeCases:
 
         assert sensor.native_value is None
 
+    async def test_value_key_split_on_first_dot_only(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test a value_key is split into section and key at the first dot."""
+        await _setup_integration(hass, mock_config_entry)
+
+        coordinator = mock_config_entry.runtime_data
+        coordinator.data.video["enc.profile"] = "high"
+
+        desc = ZowietekSensorEntityDescription(
+            key="dotted_key",
+            name="Dotted Key",
+            value_key="video.enc.profile",
+        )
+
+        sensor = ZowietekSensor(coordinator, desc)
+
+        assert sensor.native_value == "high"
+
     async def test_nonexistent_section_returns_none(
         self,
         hass: HomeAssistant,
@@ -709,6 +749,27 @@ class TestSensorEdgeCases:
 
         assert sensor.native_value is None
 
+    async def test_non_dict_section_returns_none(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_zowietek_client: MagicMock,
+    ) -> None:
+        """Test sensor returns None when the section is not a flat dict."""
+        await _setup_integration(hass, mock_config_entry)
+
+        coordinator = mock_config_entry.runtime_data
+
+        desc = ZowietekSensorEntityDescription(
+            key="ndi_list",
+            name="NDI List",
+            value_key="ndi_sources.name",
+        )
+
+        sensor = ZowietekSensor(coordinator, desc)
+
+        assert sensor.native_value is None
+
     async def test_non_standard_type_converted_to_string(
         self,
         hass: HomeAssistant,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -10,9 +11,13 @@ from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
-from custom_components.zowietek.const import DOMAIN
+from custom_components.zowietek.const import DOMAIN, OPTIMISTIC_RECONCILE_DELAY
 from custom_components.zowietek.services import (
     ATTR_DEVICE_ID,
     ATTR_GROUP,
@@ -22,6 +27,7 @@ from custom_components.zowietek.services import (
     ATTR_PASSPHRASE,
     ATTR_PORT,
     ATTR_URL,
+    DATA_DEVICE_ENTRY_IDS,
     SERVICE_SET_NDI_SETTINGS,
     SERVICE_SET_RTMP_URL,
     SERVICE_SET_SRT_SETTINGS,
@@ -539,9 +545,9 @@ class TestCoordinatorRefresh:
         device = device_registry.async_get_device(identifiers={(DOMAIN, "zowiebox-test-12345")})
         assert device is not None
 
-        # Get the coordinator and track refresh calls
+        # Get the coordinator and track scheduled refreshes
         coordinator = mock_config_entry_for_services.runtime_data
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_schedule_reconcile = MagicMock()
 
         await hass.services.async_call(
             DOMAIN,
@@ -553,8 +559,8 @@ class TestCoordinatorRefresh:
             blocking=True,
         )
 
-        # Verify refresh was requested
-        coordinator.async_request_refresh.assert_called_once()
+        # Verify a refresh was scheduled
+        coordinator.async_schedule_reconcile.assert_called_once()
 
     async def test_rtmp_url_triggers_refresh(
         self,
@@ -572,7 +578,7 @@ class TestCoordinatorRefresh:
         assert device is not None
 
         coordinator = mock_config_entry_for_services.runtime_data
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_schedule_reconcile = MagicMock()
 
         await hass.services.async_call(
             DOMAIN,
@@ -584,7 +590,7 @@ class TestCoordinatorRefresh:
             blocking=True,
         )
 
-        coordinator.async_request_refresh.assert_called_once()
+        coordinator.async_schedule_reconcile.assert_called_once()
 
     async def test_srt_settings_triggers_refresh(
         self,
@@ -602,7 +608,7 @@ class TestCoordinatorRefresh:
         assert device is not None
 
         coordinator = mock_config_entry_for_services.runtime_data
-        coordinator.async_request_refresh = AsyncMock()
+        coordinator.async_schedule_reconcile = MagicMock()
 
         await hass.services.async_call(
             DOMAIN,
@@ -614,4 +620,168 @@ class TestCoordinatorRefresh:
             blocking=True,
         )
 
-        coordinator.async_request_refresh.assert_called_once()
+        coordinator.async_schedule_reconcile.assert_called_once()
+
+    async def test_service_burst_coalesces_into_one_refresh(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_for_services: MockConfigEntry,
+    ) -> None:
+        """Test back-to-back service calls share a single delayed refresh."""
+        client = await setup_integration_with_mocked_client(
+            hass,
+            mock_config_entry_for_services,
+        )
+
+        device_registry = dr.async_get(hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, "zowiebox-test-12345")})
+        assert device is not None
+
+        coordinator = mock_config_entry_for_services.runtime_data
+        coordinator.async_request_refresh = AsyncMock()
+        polls_before = client.async_get_venc_info.call_count
+
+        for service, data in (
+            (SERVICE_SET_NDI_SETTINGS, {ATTR_NAME: "MyNDISource"}),
+            (SERVICE_SET_RTMP_URL, {ATTR_URL: "rtmp://live.example.com/live"}),
+            (SERVICE_SET_SRT_SETTINGS, {ATTR_PORT: 9000}),
+        ):
+            await hass.services.async_call(
+                DOMAIN,
+                service,
+                {ATTR_DEVICE_ID: device.id, **data},
+                blocking=True,
+            )
+
+        coordinator.async_request_refresh.assert_not_called()
+        assert client.async_get_venc_info.call_count == polls_before
+
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=OPTIMISTIC_RECONCILE_DELAY + 1)
+        )
+        await hass.async_block_till_done()
+
+        assert client.async_get_venc_info.call_count == polls_before + 1
+
+
+class TestDeviceResolution:
+    """Tests for resolving a device ID to its coordinator."""
+
+    async def test_resolved_entry_cached_until_services_unload(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_for_services: MockConfigEntry,
+    ) -> None:
+        """Test the device's config entry is cached and dropped on unload."""
+        client = await setup_integration_with_mocked_client(
+            hass,
+            mock_config_entry_for_services,
+        )
+
+        device_registry = dr.async_get(hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, "zowiebox-test-12345")})
+        assert device is not None
+
+        for name in ("First", "Second"):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_SET_NDI_SETTINGS,
+                {ATTR_DEVICE_ID: device.id, ATTR_NAME: name},
+                blocking=True,
+            )
+
+        assert client.async_set_ndi_settings.call_count == 2
+        assert hass.data[DATA_DEVICE_ENTRY_IDS] == {
+            device.id: mock_config_entry_for_services.entry_id
+        }
+
+        await hass.config_entries.async_unload(mock_config_entry_for_services.entry_id)
+        await hass.async_block_till_done()
+
+        assert DATA_DEVICE_ENTRY_IDS not in hass.data
+
+    async def test_stale_cached_entry_falls_back_to_registry(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_for_services: MockConfigEntry,
+    ) -> None:
+        """Test a cached entry that is no longer loaded is re-resolved."""
+        client = await setup_integration_with_mocked_client(
+            hass,
+            mock_config_entry_for_services,
+        )
+
+        device_registry = dr.async_get(hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, "zowiebox-test-12345")})
+        assert device is not None
+
+        hass.data.setdefault(DATA_DEVICE_ENTRY_IDS, {})[device.id] = "stale-entry-id"
+
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_NDI_SETTINGS,
+            {ATTR_DEVICE_ID: device.id, ATTR_NAME: "MyNDISource"},
+            blocking=True,
+        )
+
+        client.async_set_ndi_settings.assert_called_once()
+        assert hass.data[DATA_DEVICE_ENTRY_IDS] == {
+            device.id: mock_config_entry_for_services.entry_id
+        }
+
+    async def test_cached_entry_dropped_on_device_registry_update(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_for_services: MockConfigEntry,
+    ) -> None:
+        """Test a device registry update invalidates the cached entry."""
+        await setup_integration_with_mocked_client(
+            hass,
+            mock_config_entry_for_services,
+        )
+
+        device_registry = dr.async_get(hass)
+        device = device_registry.async_get_device(identifiers={(DOMAIN, "zowiebox-test-12345")})
+        assert device is not None
+
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_NDI_SETTINGS,
+            {ATTR_DEVICE_ID: device.id, ATTR_NAME: "MyNDISource"},
+            blocking=True,
+        )
+        assert device.id in hass.data[DATA_DEVICE_ENTRY_IDS]
+
+        device_registry.async_update_device(device.id, name_by_user="Renamed")
+        await hass.async_block_till_done()
+
+        assert device.id not in hass.data[DATA_DEVICE_ENTRY_IDS]
+
+    async def test_device_from_other_integration_rejected(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_for_services: MockConfigEntry,
+    ) -> None:
+        """Test a device owned by another integration is not resolved."""
+        await setup_integration_with_mocked_client(
+            hass,
+            mock_config_entry_for_services,
+        )
+
+        other_entry = MockConfigEntry(domain="other_domain")
+        other_entry.add_to_hass(hass)
+        device_registry = dr.async_get(hass)
+        other_device = device_registry.async_get_or_create(
+            config_entry_id=other_entry.entry_id,
+            identifiers={("other_domain", "other-device")},
+        )
+
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_SET_NDI_SETTINGS,
+                {ATTR_DEVICE_ID: other_device.id, ATTR_NAME: "MyNDISource"},
+                blocking=True,
+            )
+
+        assert other_device.id not in hass.data[DATA_DEVICE_ENTRY_IDS]